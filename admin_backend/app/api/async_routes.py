@@ -0,0 +1,126 @@
+"""
+Async routers (DB_ASYNC)
+
+Builds async versions of the sync routers. Each route gets an AsyncSession
+and runs the existing handler through ``AsyncSession.run_sync``, so the
+handler's database I/O is awaited on the event loop (asyncpg / aiosqlite)
+instead of blocking a threadpool thread. Handlers stay written once, as
+plain sync functions against a Session. Handlers without a Session still
+run in the threadpool, as FastAPI runs any sync endpoint.
+"""
+
+import inspect
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.core.cache import user_principal_cache
+from db import models
+from db.session import get_db
+from db.async_session import get_async_db
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(deps.oauth2_scheme)
+) -> deps.Principal:
+    """Async deps.get_current_user, sharing its principal cache"""
+    token_data = deps.decode_token(token)
+    principal = user_principal_cache.get(token_data.user_id)
+    if principal is not None:
+        return principal
+
+    generation = user_principal_cache.generation
+    user = await db.get(models.User, token_data.user_id)
+    if user is None:
+        raise deps.credentials_exception()
+
+    principal = deps.Principal.from_user(user)
+    user_principal_cache.set(token_data.user_id, principal, generation=generation)
+    return principal
+
+
+async def get_current_active_user_async(
+    current_user: deps.Principal = Depends(get_current_user_async),
+) -> deps.Principal:
+    return deps.get_current_active_user(current_user)
+
+
+async def get_current_admin_user_async(
+    current_user: deps.Principal = Depends(get_current_active_user_async),
+) -> deps.Principal:
+    return deps.get_current_admin_user(current_user)
+
+
+# Sync dependency -> async replacement
+ASYNC_DEPENDENCIES = {
+    get_db: get_async_db,
+    deps.get_current_user: get_current_user_async,
+    deps.get_current_active_user: get_current_active_user_async,
+    deps.get_current_admin_user: get_current_admin_user_async,
+}
+
+
+def _asyncify_endpoint(func: Callable, response_model: Optional[type]) -> Callable:
+    """Wrap a sync handler so it runs on an AsyncSession"""
+    signature = inspect.signature(func)
+    db_param = None
+    params = []
+    for param in signature.parameters.values():
+        dependency = getattr(param.default, "dependency", None)
+        if dependency is get_db:
+            db_param = param.name
+            param = param.replace(default=Depends(get_async_db), annotation=AsyncSession)
+        elif dependency in ASYNC_DEPENDENCIES:
+            param = param.replace(default=Depends(ASYNC_DEPENDENCIES[dependency]))
+        params.append(param)
+
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def call(session, kwargs):
+        result = func(**kwargs, **{db_param: session})
+        if adapter is not None and not isinstance(result, Response):
+            # Serialize ORM results here, where lazy loads can still reach the database
+            result = adapter.validate_python(result, from_attributes=True)
+        return result
+
+    async def endpoint(**kwargs):
+        if db_param is None:
+            return await run_in_threadpool(func, **kwargs)
+        db = kwargs.pop(db_param)
+        return await db.run_sync(call, kwargs)
+
+    endpoint.__name__ = func.__name__
+    endpoint.__doc__ = func.__doc__
+    endpoint.__signature__ = signature.replace(parameters=params)
+    return endpoint
+
+
+def asyncify_router(router: APIRouter) -> APIRouter:
+    """Copy of ``router`` whose routes run on the async engine"""
+    async_router = APIRouter()
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            async_router.routes.append(route)
+            continue
+        async_router.add_api_route(
+            route.path,
+            _asyncify_endpoint(route.endpoint, route.response_model),
+            methods=list(route.methods),
+            response_model=route.response_model,
+            status_code=route.status_code,
+            tags=route.tags,
+            summary=route.summary,
+            description=route.description,
+            response_description=route.response_description,
+            responses=route.responses,
+            deprecated=route.deprecated,
+            name=route.name,
+            include_in_schema=route.include_in_schema,
+            response_class=route.response_class,
+        )
+    return async_router
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 import random
 import string
@@ -7,9 +8,12 @@ from typing import Any
 from db.session import get_db
 from db import models
 from app.core import security
+from app.core.cache import invalidate_user_principal
 from app.api import deps
 from app.schemas import user as schemas, organization as org_schemas
-from app.core.email_utils import send_verification_email
+from app.core.email_utils import build_verification_email
+from app.services.email_outbox import enqueue_email
+from app.services.event_bus import event_bus
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
 
@@ -21,15 +25,26 @@ router = APIRouter(
 def generate_verification_code():
     return ''.join(random.choices(string.digits, k=6))
 
+# Password hashing handlers are async: Argon2 runs on security.password_hasher
+# and only the database work goes to the request threadpool, so a burst of
+# logins queues on the hashing pool instead of occupying request threads.
+
 @router.post("/register", response_model=Any)
-def register(
+async def register(
     user_in: schemas.UserCreate, 
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Register a new user.
     """
+    hashed_password = await security.password_hasher.hash(user_in.password)
+    return await run_in_threadpool(_register, user_in, hashed_password, db)
+
+def _register(
+    user_in: schemas.UserCreate,
+    hashed_password: str,
+    db: Session
+):
     try:
         # Check if user already exists
         user = db.query(models.User).filter(models.User.email == user_in.email).first()
@@ -39,7 +54,7 @@ def register(
             else:
                 # User exists but is NOT verified (e.g. abandoned registration)
                 # Overwrite their details and restart verification
-                user.hashed_password = security.get_password_hash(user_in.password)
+                user.hashed_password = hashed_password
                 user.full_name = user_in.full_name
                 user.role = user_in.role
                 
@@ -51,12 +66,13 @@ def register(
                 db_code = models.VerificationCode(email=user_in.email, code=code)
                 db.add(db_code)
                 
+                # Queue verification email (sent once committed)
+                enqueue_email(db, build_verification_email(user_in.email, code))
+                
                 db.commit()
+                invalidate_user_principal(user.id)
                 db.refresh(user)
                 
-                # Send verification email in background
-                background_tasks.add_task(send_verification_email, user_in.email, code)
-                
                 return {
                     "message": "Registration restarted. Check your email."
                 }
@@ -64,7 +80,7 @@ def register(
         # Create new user
         db_user = models.User(
             email=user_in.email,
-            hashed_password=security.get_password_hash(user_in.password),
+            hashed_password=hashed_password,
             full_name=user_in.full_name,
             role=user_in.role, 
             is_verified=False
@@ -76,12 +92,12 @@ def register(
         db_code = models.VerificationCode(email=user_in.email, code=code)
         db.add(db_code)
         
+        # Queue verification email (sent once committed)
+        enqueue_email(db, build_verification_email(user_in.email, code))
+        
         db.commit()
         db.refresh(db_user)
         
-        # Send verification email in background
-        background_tasks.add_task(send_verification_email, user_in.email, code)
-        
         return {
             "message": "User registered successfully"
         }
@@ -115,6 +131,7 @@ def verify_email_route(data: VerifyCodeSchema, db: Session = Depends(get_db)):
         user.is_verified = True
         db.delete(db_code) # Remove used code
         db.commit()
+        invalidate_user_principal(user.id)
         db.refresh(user)
         
         # Generate token after verification
@@ -130,7 +147,6 @@ def verify_email_route(data: VerifyCodeSchema, db: Session = Depends(get_db)):
 @router.post("/resend-code")
 def resend_code(
     data: EmailSchema,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     user = db.query(models.User).filter(models.User.email == data.email).first()
@@ -147,22 +163,27 @@ def resend_code(
     code = generate_verification_code()
     db_code = models.VerificationCode(email=data.email, code=code)
     db.add(db_code)
-    db.commit()
     
-    # Send email
-    background_tasks.add_task(send_verification_email, data.email, code)
+    # Queue email (sent once committed)
+    enqueue_email(db, build_verification_email(data.email, code))
+    db.commit()
     
     return {"message": "Verification code resent"}
 
+def _get_user_by_email(db: Session, email: str) -> Optional[models.User]:
+    return db.query(models.User).filter(models.User.email == email).first()
+
 @router.post("/login", response_model=schemas.Token)
-def login(user_in: schemas.UserLogin, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == user_in.email).first()
+async def login(user_in: schemas.UserLogin, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(_get_user_by_email, db, user_in.email)
     
     if not user:
         # USER REQUEST: Explicitly say email not registered
         raise HTTPException(status_code=404, detail="Email not registered")
         
-    keyword_match = security.verify_password(user_in.password, user.hashed_password)
+    keyword_match, new_hash = await security.password_hasher.verify_and_update(
+        user_in.password, user.hashed_password
+    )
     
     if not keyword_match:
         # USER REQUEST: Explicitly say incorrect password
@@ -171,17 +192,23 @@ def login(user_in: schemas.UserLogin, db: Session = Depends(get_db)):
     if not user.is_verified:
         raise HTTPException(status_code=400, detail="Email not verified")
     
+    email, user_id, role = user.email, user.id, user.role
+    
+    if new_hash:
+        # Stored hash predates the current Argon2 parameters; upgrade it
+        user.hashed_password = new_hash
+        await run_in_threadpool(db.commit)
+    
     access_token = security.create_access_token(
-        subject=user.email,
-        user_id=user.id,
-        role=user.role
+        subject=email,
+        user_id=user_id,
+        role=role
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.post("/forgot-password")
 def forgot_password(
     data: EmailSchema,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -200,23 +227,30 @@ def forgot_password(
     code = generate_verification_code()
     db_code = models.VerificationCode(email=data.email, code=code)
     db.add(db_code)
-    db.commit()
     
-    # Send email
+    # Queue email (sent once committed)
     subject = "Reset Your Password - Relivo"
     heading = "Password Reset Code"
-    background_tasks.add_task(send_verification_email, data.email, code, subject, heading)
+    enqueue_email(db, build_verification_email(data.email, code, subject, heading))
+    db.commit()
     
     return {"message": "Password reset OTP sent"}
 
 @router.post("/reset-password")
-def reset_password(
+async def reset_password(
     data: schemas.PasswordResetConfirm,
     db: Session = Depends(get_db)
 ):
     """
     Verify OTP and reset password.
     """
+    user, db_code = await run_in_threadpool(_get_password_reset_target, db, data)
+    hashed_password = await security.password_hasher.hash(data.new_password)
+    await run_in_threadpool(_complete_password_reset, db, user, db_code, hashed_password)
+    
+    return {"message": "Password reset successfully"}
+
+def _get_password_reset_target(db: Session, data: schemas.PasswordResetConfirm):
     # Verify code
     db_code = db.query(models.VerificationCode).filter(
         models.VerificationCode.email == data.email,
@@ -231,8 +265,11 @@ def reset_password(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    return user, db_code
+
+def _complete_password_reset(db: Session, user: models.User, db_code: models.VerificationCode, hashed_password: str):
     # Reset Password
-    user.hashed_password = security.get_password_hash(data.new_password)
+    user.hashed_password = hashed_password
     
     # Also verify user if not already (since they proved ownership of email)
     if not user.is_verified:
@@ -241,8 +278,7 @@ def reset_password(
     # Delete code
     db.delete(db_code)
     db.commit()
-    
-    return {"message": "Password reset successfully"}
+    invalidate_user_principal(user.id)
 
 @router.get("/me", response_model=schemas.UserResponse)
 def read_users_me(current_user: models.User = Depends(deps.get_current_active_user)):
@@ -290,5 +326,7 @@ def update_organization_status(
             user.role = 'organization'
     
     db.commit()
+    invalidate_user_principal(org.user_id)
+    event_bus.publish("organization", db=db, action="status-changed", id=org_id, status=status_update)
     db.refresh(org)
     return org
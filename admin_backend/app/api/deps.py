@@ -1,4 +1,6 @@
-from typing import Generator
+import secrets
+from dataclasses import dataclass
+from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
@@ -6,20 +8,48 @@ from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.cache import user_principal_cache
 from app.schemas import user as schemas
 from db import models
 from db.session import get_db
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> models.User:
-    credentials_exception = HTTPException(
+@dataclass(frozen=True)
+class Principal:
+    """
+    The authenticated user, as cached by get_current_user.
+
+    Plain copies of the row's values with no validation, so legacy rows
+    (NULL role or is_active, emails EmailStr would reject) still authenticate;
+    only response models such as /auth/me validate them.
+    """
+    id: int
+    email: str
+    full_name: Optional[str] = None
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
+    is_verified: Optional[bool] = None
+
+    @classmethod
+    def from_user(cls, user: models.User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+        )
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def decode_token(token: str) -> schemas.TokenData:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -29,34 +59,59 @@ def get_current_user(
         role: str = payload.get("role")
         
         if email is None or user_id is None:
-            raise credentials_exception
+            raise credentials_exception()
             
-        token_data = schemas.TokenData(email=email, user_id=user_id, role=role)
+        return schemas.TokenData(email=email, user_id=user_id, role=role)
     except (JWTError, ValidationError):
-        raise credentials_exception
-        
+        raise credentials_exception()
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """
+    Resolve the bearer token to the user's principal.
+
+    Principals are cached by user id for AUTH_USER_CACHE_TTL_SECONDS, so a
+    cache hit needs no database access. Endpoints that change a user's role
+    or status must call invalidate_user_principal().
+    """
+    token_data = decode_token(token)
+    principal = user_principal_cache.get(token_data.user_id)
+    if principal is not None:
+        return principal
+    
+    generation = user_principal_cache.generation
     user = db.query(models.User).filter(models.User.id == token_data.user_id).first()
     if user is None:
-        raise credentials_exception
-    
-    # Optional: Verify role matches if needed, but for now just getting user is enough.
-    # We could attach the role from token if we trust the token more than DB for performance,
-    # but DB is safer.
+        raise credentials_exception()
     
-    return user
+    principal = Principal.from_user(user)
+    user_principal_cache.set(token_data.user_id, principal, generation=generation)
+    return principal
 
 def get_current_active_user(
-    current_user: models.User = Depends(get_current_user),
-) -> models.User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 def get_current_admin_user(
-    current_user: models.User = Depends(get_current_active_user),
-) -> models.User:
+    current_user: Principal = Depends(get_current_active_user),
+) -> Principal:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+def get_metrics_access(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> None:
+    """
+    Guard for the /metrics endpoints: the METRICS_TOKEN bearer token (for
+    Prometheus and other scrapers), or an active admin's access token.
+    """
+    if settings.METRICS_TOKEN and secrets.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        return
+    get_current_admin_user(get_current_active_user(get_current_user(db, token)))
@@ -0,0 +1,89 @@
+"""
+Live Events API
+
+Server-Sent Events stream of moderation changes (grants and organizations),
+fed by the in-process event bus. Dashboards listen here instead of polling
+the unverified/pending lists; each event is small, and clients refetch or
+use /grants/changes for the details.
+"""
+
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.api import deps
+from app.core.config import settings
+from app.services.event_bus import event_bus
+from db.session import SessionLocal
+
+router = APIRouter(
+    prefix="/events",
+    tags=["events"]
+)
+
+TOPICS = ("grant", "organization")
+
+
+def _stream_admin_user(token: str = Depends(deps.oauth2_scheme)) -> deps.Principal:
+    """
+    Admin check for long-lived streams. Uses its own short session rather
+    than get_db, which would hold a pooled connection for the whole stream.
+    """
+    db = SessionLocal()
+    try:
+        user = deps.get_current_user(db=db, token=token)
+    finally:
+        db.close()
+    return deps.get_current_admin_user(deps.get_current_active_user(user))
+
+
+def _format_event(event: dict) -> str:
+    return f"event: {event['topic']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+@router.get("/moderation")
+async def moderation_events(
+    request: Request,
+    topics: Optional[str] = Query(None, description="Comma-separated topics: grant, organization (default both)"),
+    current_user: deps.Principal = Depends(_stream_admin_user)
+):
+    """
+    Server-Sent Events stream of grant and organization changes (admin only).
+
+    Each event is named after its topic and carries JSON such as
+    ``{"topic": "grant", "action": "verified", "id": 42}``. A ``resync``
+    event means this client fell behind and should refetch its lists.
+    Comment lines are sent as heartbeats to keep proxies from closing the stream.
+    Unknown topics are ignored; 400 if none of the requested topics exist.
+    """
+    wanted = [t.strip() for t in topics.split(",") if t.strip() in TOPICS] if topics else TOPICS
+    if not wanted:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No valid topics in '{topics}'. Valid topics: {', '.join(TOPICS)}"
+        )
+    subscription = event_bus.subscribe(list(wanted) + ["resync"])
+
+    async def stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=settings.EVENT_STREAM_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield _format_event(event)
+        finally:
+            event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
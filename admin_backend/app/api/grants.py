@@ -5,24 +5,165 @@ Provides endpoints for:
 - Public grant access (verified & active only)
 - Admin grant management (CRUD)
 - Grant verification workflow
+- Bulk moderation (set-based updates by ids or filter)
+- Change feed for incremental client sync
 - Grants.gov import
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic_core import to_json
+from sqlalchemy import Integer, and_, any_, bindparam, insert, literal, or_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, Query as OrmQuery
 
 from db import models
 from app.schemas import grant as schemas
 from app.api import deps
 from db.session import get_db
-from app.services.grants_gov_importer import GrantsGovImporter
+from app.services.import_jobs import import_jobs
+from app.services.grants_gov_importer import local_extract_path
+from app.services import grant_search, grant_stats, grant_version
+from app.services.event_bus import event_bus
+from app.core import http_cache
+from app.core.config import settings
+from app.core.cache import grant_list_cache, invalidate_grant_caches
+from app.core.pagination import apply_keyset, decode_cursor, encode_cursor
 
 router = APIRouter(
     prefix="/grants",
     tags=["grants"]
 )
 
+# Response fields in schema order; each maps to a column (or column_property) of the same name
+GRANT_FIELDS = tuple(schemas.Grant.model_fields)
+
+# Long text and list fields left out of view=summary
+SUMMARY_EXCLUDED_FIELDS = frozenset({"description", "eligibility", "eligibility_criteria", "required_documents"})
+
+
+def _grant_projection(fields: Optional[str], view: str) -> tuple:
+    """
+    Resolve the ``fields`` and ``view`` query parameters into the response
+    fields, in schema order. Unknown field names are a 400.
+    """
+    if fields:
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested.difference(GRANT_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown grant field(s): {', '.join(sorted(unknown))}"
+            )
+    else:
+        requested = set(GRANT_FIELDS)
+    if view == "summary":
+        requested -= SUMMARY_EXCLUDED_FIELDS
+    return tuple(name for name in GRANT_FIELDS if name in requested)
+
+
+def _select_fields(query: OrmQuery, projection: tuple, extra: tuple = ()) -> OrmQuery:
+    """
+    Turn a Grant query into a row-tuple query over just the projected columns.
+    ``extra`` columns (e.g. the keyset sort key) are appended after them.
+    """
+    names = projection + tuple(name for name in extra if name not in projection)
+    return query.with_entities(*(getattr(models.Grant, name) for name in names))
+
+
+def _rows_to_json(rows: list, projection: tuple) -> bytes:
+    """
+    Serialize row tuples straight to JSON.
+    
+    The values come from typed columns, so re-validating them through the
+    Pydantic model would only cost CPU. zip() stops at the projection,
+    dropping any extra columns selected for pagination.
+    """
+    return to_json([dict(zip(projection, row)) for row in rows])
+
+
+def _grant_list_page(
+    request: Request,
+    key: tuple,
+    query: OrmQuery,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    projection: tuple = GRANT_FIELDS,
+) -> Response:
+    """
+    Serve a page of grants ordered by (created_at desc, id desc).
+    
+    With ``cursor`` the page is fetched by keyset seek; otherwise by offset.
+    When the page is full, the ``X-Next-Cursor`` header carries the cursor
+    for the next page in either mode.
+    
+    Only the projected columns are selected, and rows are serialized
+    without building ORM objects or Pydantic models.
+    
+    ETags combine the grants-table version with the request parameters, so
+    a matching If-None-Match gets a 304 after a single version read.
+    
+    Pages come from the response cache when possible: on a miss the query
+    runs once and the serialized JSON (plus its gzip form, for large pages)
+    is stored, so a hit costs only the version read, skipping the page query
+    and compression. That read is kept deliberately: the version is part of
+    the cache key, so a write made through any app worker is seen on the
+    next request instead of after GRANT_CACHE_TTL_SECONDS. Write endpoints
+    also clear this worker's cache.
+    """
+    key = key + (skip, limit, cursor, projection)
+    version = grant_version.current_version(query.session)
+    etag = http_cache.make_etag(version, key)
+    gzip_etag = http_cache.make_etag(version, key, "gzip")
+    if http_cache.etag_matches(request, etag):
+        return http_cache.not_modified(etag)
+    if http_cache.etag_matches(request, gzip_etag):
+        return http_cache.not_modified(gzip_etag)
+    
+    cache_key = key + (version,)
+    cached = grant_list_cache.get(cache_key)
+    if cached is None:
+        generation = grant_list_cache.generation
+        if cursor:
+            query = apply_keyset(query, models.Grant.created_at, models.Grant.id, cursor)
+        else:
+            query = query.offset(skip)
+        sort_key = ("created_at", "id")
+        rows = _select_fields(query, projection, extra=sort_key).limit(limit).all()
+        
+        next_cursor = None
+        if rows and len(rows) == limit:
+            last = rows[-1]._mapping
+            next_cursor = encode_cursor(last["created_at"], last["id"])
+        
+        body = _rows_to_json(rows, projection)
+        cached = (body, http_cache.compress(body), next_cursor)
+        grant_list_cache.set(cache_key, cached, generation=generation)
+    
+    body, gzip_body, next_cursor = cached
+    headers = {"ETag": etag, "Cache-Control": http_cache.CACHE_CONTROL}
+    if gzip_body is None:
+        headers["Vary"] = "Accept-Encoding"
+    elif http_cache.accepts_gzip(request):
+        body = gzip_body
+        headers.update({"ETag": gzip_etag, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+    # Otherwise GZipMiddleware sees a large uncompressed body and adds Vary itself
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _grants_changed(db: Session, action: str, **details):
+    """
+    Call after committing any write to the grants table. ``action`` and
+    ``details`` (e.g. id=42) describe it to live dashboards.
+    """
+    invalidate_grant_caches()
+    grant_stats.on_grants_changed(db)
+    event_bus.publish("grant", db=db, action=action, **details)
+
+
 # ============================================================================
 # PUBLIC ENDPOINTS (No Auth Required)
 # ============================================================================
@@ -46,50 +187,87 @@ router = APIRouter(
 
 @router.get("/admin/verified", response_model=List[schemas.Grant])
 def get_verified_grants(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; replaces skip"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,deadline"),
+    view: Literal["full", "summary"] = Query("full", description="summary omits description, eligibility and document lists"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(deps.get_current_admin_user)
 ):
     """
     Get all verified grants (admin only).
     """
-    grants = db.query(models.Grant).options(joinedload(models.Grant.creator)).filter(
+    query = db.query(models.Grant).filter(
         models.Grant.is_verified == True
-    ).order_by(models.Grant.created_at.desc()).offset(skip).limit(limit).all()
-    return grants
+    ).order_by(models.Grant.created_at.desc(), models.Grant.id.desc())
+    return _grant_list_page(request, ("verified",), query, skip, limit, cursor, _grant_projection(fields, view))
 
 
 @router.get("/admin/unverified", response_model=List[schemas.Grant])
 def get_unverified_grants(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; replaces skip"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,deadline"),
+    view: Literal["full", "summary"] = Query("full", description="summary omits description, eligibility and document lists"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(deps.get_current_admin_user)
 ):
     """
     Get all unverified grants (admin only).
     """
-    grants = db.query(models.Grant).options(joinedload(models.Grant.creator)).filter(
+    query = db.query(models.Grant).filter(
         models.Grant.is_verified == False
-    ).order_by(models.Grant.created_at.desc()).offset(skip).limit(limit).all()
-    return grants
+    ).order_by(models.Grant.created_at.desc(), models.Grant.id.desc())
+    return _grant_list_page(request, ("unverified",), query, skip, limit, cursor, _grant_projection(fields, view))
 
 
 @router.get("/admin/all", response_model=List[schemas.Grant])
 def get_all_grants_admin(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; replaces skip"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,deadline"),
+    view: Literal["full", "summary"] = Query("full", description="summary omits description, eligibility and document lists"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(deps.get_current_admin_user)
 ):
     """
     Get all grants regardless of verification status (admin only).
     """
-    grants = db.query(models.Grant).options(joinedload(models.Grant.creator)).order_by(
-        models.Grant.created_at.desc()
-    ).offset(skip).limit(limit).all()
-    return grants
+    query = db.query(models.Grant).order_by(
+        models.Grant.created_at.desc(), models.Grant.id.desc()
+    )
+    return _grant_list_page(request, ("all",), query, skip, limit, cursor, _grant_projection(fields, view))
+
+
+@router.get("/search", response_model=List[schemas.Grant])
+def search_grants(
+    q: str = Query(..., min_length=1, description="Search terms"),
+    is_verified: Optional[bool] = None,
+    is_active: Optional[bool] = None,
+    country: Optional[str] = Query(None, description="Filter by refugee country"),
+    skip: int = 0,
+    limit: int = 50,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,deadline"),
+    view: Literal["full", "summary"] = Query("full", description="summary omits description, eligibility and document lists"),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """
+    Full-text search over title, organizer, description and eligibility (admin only).
+    Results are ranked best match first.
+    """
+    query = grant_search.search_grants_query(
+        db, q, is_verified=is_verified, is_active=is_active, country=country
+    )
+    projection = _grant_projection(fields, view)
+    rows = _select_fields(query, projection).offset(skip).limit(limit).all()
+    return Response(content=_rows_to_json(rows, projection), media_type="application/json")
 
 
 @router.post("/admin", response_model=schemas.Grant)
@@ -106,6 +284,7 @@ def create_grant(
     db.add(grant)
     db.commit()
     db.refresh(grant)
+    _grants_changed(db, "created", id=grant.id)
     return grant
 
 
@@ -131,6 +310,7 @@ def update_grant(
     
     db.add(grant)
     db.commit()
+    _grants_changed(db, "updated", id=grant_id)
     db.refresh(grant)
     return grant
 
@@ -150,6 +330,7 @@ def delete_grant(
     
     db.delete(grant)
     db.commit()
+    _grants_changed(db, "deleted", id=grant_id)
     return {"message": "Grant deleted successfully", "id": grant_id}
 
 
@@ -173,6 +354,7 @@ def verify_grant(
     
     grant.is_verified = True
     db.commit()
+    _grants_changed(db, "verified", id=grant_id)
     db.refresh(grant)
     return grant
 
@@ -193,6 +375,7 @@ def unverify_grant(
     
     grant.is_verified = False
     db.commit()
+    _grants_changed(db, "unverified", id=grant_id)
     db.refresh(grant)
     return grant
 
@@ -213,6 +396,7 @@ def activate_grant(
     
     grant.is_active = True
     db.commit()
+    _grants_changed(db, "activated", id=grant_id)
     db.refresh(grant)
     return grant
 
@@ -233,37 +417,255 @@ def deactivate_grant(
     
     grant.is_active = False
     db.commit()
+    _grants_changed(db, "deactivated", id=grant_id)
     db.refresh(grant)
     return grant
 
 
 # ============================================================================
-# GRANTS.GOV IMPORT ENDPOINT
+# BULK MODERATION ENDPOINTS
 # ============================================================================
 
-@router.post("/admin/import", response_model=schemas.GrantImportResult)
-def import_grants_from_grants_gov(
-    xml_url: Optional[str] = Query(None, description="Optional custom URL for XML extract"),
+def _bulk_query(db: Session, selection: schemas.GrantBulkAction) -> OrmQuery:
+    """Grants matched by a bulk action's ids and/or filter; 400 if it selects nothing explicit"""
+    grant_filter = selection.filter.dict(exclude_none=True) if selection.filter else {}
+    if selection.ids is None and not grant_filter:
+        raise HTTPException(status_code=400, detail="Provide ids and/or a non-empty filter")
+    
+    query = db.query(models.Grant)
+    if selection.ids is not None:
+        if db.get_bind().dialect.name == "postgresql":
+            # One array parameter instead of an IN list of thousands of binds
+            ids = bindparam("bulk_ids", list(selection.ids), type_=ARRAY(Integer))
+            query = query.filter(models.Grant.id == any_(ids))
+        else:
+            query = query.filter(models.Grant.id.in_(selection.ids))
+    
+    created_after = grant_filter.pop("created_after", None)
+    created_before = grant_filter.pop("created_before", None)
+    if created_after:
+        query = query.filter(models.Grant.created_at >= created_after)
+    if created_before:
+        query = query.filter(models.Grant.created_at < created_before)
+    for field, value in grant_filter.items():
+        query = query.filter(getattr(models.Grant, field) == value)
+    return query
+
+
+def _bulk_update(db: Session, selection: schemas.GrantBulkAction, action: str, values: dict) -> schemas.GrantBulkResult:
+    """Apply ``values`` to every selected grant in a single UPDATE"""
+    values[models.Grant.change_seq] = grant_version.next_version(db)
+    affected = _bulk_query(db, selection).update(values, synchronize_session=False)
+    db.commit()
+    _grants_changed(db, f"bulk-{action}", affected=affected)
+    return schemas.GrantBulkResult(action=action, affected=affected)
+
+
+@router.post("/admin/bulk/verify", response_model=schemas.GrantBulkResult)
+def bulk_verify_grants(
+    selection: schemas.GrantBulkAction,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """Verify every selected grant (admin only)."""
+    return _bulk_update(db, selection, "verify", {models.Grant.is_verified: True})
+
+
+@router.post("/admin/bulk/unverify", response_model=schemas.GrantBulkResult)
+def bulk_unverify_grants(
+    selection: schemas.GrantBulkAction,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """Unverify every selected grant (admin only)."""
+    return _bulk_update(db, selection, "unverify", {models.Grant.is_verified: False})
+
+
+@router.post("/admin/bulk/activate", response_model=schemas.GrantBulkResult)
+def bulk_activate_grants(
+    selection: schemas.GrantBulkAction,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """Activate every selected grant (admin only)."""
+    return _bulk_update(db, selection, "activate", {models.Grant.is_active: True})
+
+
+@router.post("/admin/bulk/deactivate", response_model=schemas.GrantBulkResult)
+def bulk_deactivate_grants(
+    selection: schemas.GrantBulkAction,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """Deactivate every selected grant (admin only)."""
+    return _bulk_update(db, selection, "deactivate", {models.Grant.is_active: False})
+
+
+@router.post("/admin/bulk/set-fields", response_model=schemas.GrantBulkResult)
+def bulk_set_grant_fields(
+    selection: schemas.GrantBulkSetFields,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """Set refugee_country and/or category on every selected grant (admin only)."""
+    values = {}
+    if selection.refugee_country is not None:
+        values[models.Grant.refugee_country] = selection.refugee_country
+    if selection.category is not None:
+        values[models.Grant.category] = selection.category
+    if not values:
+        raise HTTPException(status_code=400, detail="Provide refugee_country and/or category")
+    return _bulk_update(db, selection, "set-fields", values)
+
+
+@router.post("/admin/bulk/delete", response_model=schemas.GrantBulkResult)
+def bulk_delete_grants(
+    selection: schemas.GrantBulkAction,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """Delete every selected grant in a single DELETE (admin only)."""
+    query = _bulk_query(db, selection)
+    version = grant_version.next_version(db)
+    db.execute(insert(models.GrantTombstone).from_select(
+        ["grant_id", "change_seq"],
+        query.with_entities(models.Grant.id, literal(version)).statement,
+    ))
+    affected = query.delete(synchronize_session=False)
+    db.commit()
+    _grants_changed(db, "bulk-delete", affected=affected)
+    return schemas.GrantBulkResult(action="delete", affected=affected)
+
+
+# ============================================================================
+# CHANGE FEED
+# ============================================================================
+
+# Feed order within one change_seq: upserts, then deletes; _END is past both
+_UPSERT, _DELETE, _END = 0, 1, 2
+
+
+def _after_position(seq_column, id_column, kind: int, position: tuple):
+    """Filter for rows of ``kind`` after ``position`` = (change_seq, kind, id) in feed order"""
+    seq, position_kind, last_id = position
+    if kind < position_kind:
+        return seq_column > seq
+    if kind > position_kind:
+        return seq_column >= seq
+    return or_(seq_column > seq, and_(seq_column == seq, id_column > last_id))
+
+
+def _decode_change_token(token: str) -> tuple:
+    values = decode_cursor(token)
+    if len(values) != 3 or not all(isinstance(value, int) for value in values):
+        raise HTTPException(status_code=400, detail="Invalid change token")
+    return tuple(values)
+
+
+@router.get("/changes", response_model=schemas.GrantChanges)
+def get_grant_changes(
+    since: Optional[str] = Query(None, description="next_token from the previous call; omit for a full sync"),
+    limit: int = Query(500, ge=1, le=5000),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,title,deadline"),
+    view: Literal["full", "summary"] = Query("full", description="summary omits description, eligibility and document lists"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(deps.get_current_admin_user)
 ):
     """
-    Import grants from Grants.gov XML extract (admin only).
+    Grants created, updated or deleted since a change token (admin only).
     
-    Downloads the latest XML extract, parses it, and imports new grants.
-    Existing grants (matched by external_id) are skipped to preserve admin edits.
-    
-    Returns:
-        GrantImportResult with counts of imported, skipped, and errors
+    Clients keep a local copy and sync in O(changes): apply ``deleted``, then
+    upsert ``upserted`` by id, and call again with ``next_token`` while
+    ``has_more`` is true. The final token is the position to sync from next time.
     """
-    importer = GrantsGovImporter(db)
-    result = importer.import_grants(xml_url=xml_url)
+    position = _decode_change_token(since) if since else (-1, _END, 0)
+    # Every write stamped at or below this version has committed (see grant_version)
+    upper = grant_version.current_version(db)
+    
+    projection = _grant_projection(fields, view)
+    if "id" not in projection:
+        projection = tuple(name for name in GRANT_FIELDS if name == "id" or name in projection)
     
-    return schemas.GrantImportResult(
-        imported=result["imported"],
-        skipped=result["skipped"],
-        errors=result["errors"]
+    Grant, Tombstone = models.Grant, models.GrantTombstone
+    upserts = _select_fields(
+        db.query(Grant).filter(
+            Grant.change_seq <= upper,
+            _after_position(Grant.change_seq, Grant.id, _UPSERT, position),
+        ),
+        projection,
+        extra=("change_seq", "id"),
+    ).order_by(Grant.change_seq, Grant.id).limit(limit + 1).all()
+    deletes = db.query(Tombstone.change_seq, Tombstone.id, Tombstone.grant_id).filter(
+        Tombstone.change_seq <= upper,
+        _after_position(Tombstone.change_seq, Tombstone.id, _DELETE, position),
+    ).order_by(Tombstone.change_seq, Tombstone.id).limit(limit + 1).all()
+    
+    # Merge both streams in feed order; more than ``limit`` means the feed continues
+    entries = sorted(
+        [((row._mapping["change_seq"], _UPSERT, row._mapping["id"]), row) for row in upserts] +
+        [((row.change_seq, _DELETE, row.id), row) for row in deletes],
+        key=lambda entry: entry[0],
     )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    next_position = entries[-1][0] if has_more else (upper, _END, 0)
+    
+    body = {
+        "upserted": [dict(zip(projection, row)) for key, row in entries if key[1] == _UPSERT],
+        "deleted": [row.grant_id for key, row in entries if key[1] == _DELETE],
+        "next_token": encode_cursor(*next_position),
+        "has_more": has_more,
+    }
+    return Response(content=to_json(body), media_type="application/json")
+
+
+# ============================================================================
+# GRANTS.GOV IMPORT ENDPOINT
+# ============================================================================
+
+@router.post("/admin/import", response_model=schemas.ImportJobStatus, status_code=202)
+def import_grants_from_grants_gov(
+    xml_url: Optional[str] = Query(None, description="Optional custom URL for XML extract"),
+    full: bool = Query(False, description="Ignore ETag and content fingerprints and reprocess the whole extract"),
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """
+    Start a background import from the Grants.gov XML extract (admin only).
+    
+    Returns immediately with a job id; poll /grants/admin/import/jobs/{job_id}
+    for progress. Existing grants (matched by external_id) are skipped to
+    preserve admin edits. Imports are incremental by default: an unchanged
+    extract is not downloaded and unchanged opportunities are skipped before
+    any database work. If an import is already running, that job is returned.
+    """
+    if xml_url and local_extract_path(xml_url) is not None and not settings.GRANTS_IMPORT_LOCAL_FILES:
+        raise HTTPException(status_code=400, detail="xml_url must be an http(s) URL")
+    job, created = import_jobs.submit(xml_url=xml_url, incremental=not full)
+    return schemas.ImportJobStatus(**job.to_dict(), deduplicated=not created)
+
+
+@router.get("/admin/import/jobs", response_model=List[schemas.ImportJobStatus])
+def list_import_jobs(
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """
+    List recent import jobs, newest first (admin only).
+    """
+    return [schemas.ImportJobStatus(**job.to_dict()) for job in import_jobs.list()]
+
+
+@router.get("/admin/import/jobs/{job_id}", response_model=schemas.ImportJobStatus)
+def get_import_job(
+    job_id: str,
+    current_user: models.User = Depends(deps.get_current_admin_user)
+):
+    """
+    Get phase, rows processed, throughput and errors of an import job (admin only).
+    """
+    job = import_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return schemas.ImportJobStatus(**job.to_dict())
 
 
 # ============================================================================
@@ -277,23 +679,11 @@ def get_grant_statistics(
 ):
     """
     Get grant statistics (admin only).
+
+    Includes the insights breakdowns (created this month, expiring soon,
+    by creator type / category / country), aggregated in the database.
     """
-    total = db.query(models.Grant).count()
-    verified = db.query(models.Grant).filter(models.Grant.is_verified == True).count()
-    unverified = db.query(models.Grant).filter(models.Grant.is_verified == False).count()
-    active = db.query(models.Grant).filter(models.Grant.is_active == True).count()
-    from_grants_gov = db.query(models.Grant).filter(models.Grant.source == "grants.gov").count()
-    manual = db.query(models.Grant).filter(models.Grant.source == "manual").count()
-    
-    return {
-        "total": total,
-        "verified": verified,
-        "unverified": unverified,
-        "active": active,
-        "inactive": total - active,
-        "from_grants_gov": from_grants_gov,
-        "manual": manual
-    }
+    return grant_stats.get_grant_stats(db)
 
 
 @router.post("/admin/migrate-schema")
@@ -350,6 +740,7 @@ def migrate_schema(
             'category': 'VARCHAR(100) DEFAULT \'General\'',
             'eligibility_criteria': 'JSON',
             'required_documents': 'JSON',
+            'change_seq': 'INTEGER NOT NULL DEFAULT 0',
         }
         
         for column_name, column_type in column_definitions.items():
@@ -367,9 +758,23 @@ def migrate_schema(
             db.execute(text("UPDATE grants SET is_verified = FALSE WHERE is_verified IS NULL"))
             # Set default is_active for existing records
             db.execute(text("UPDATE grants SET is_active = TRUE WHERE is_active IS NULL"))
+            # Change-feed clients must refetch rows the defaults above may have touched
+            db.execute(
+                text("UPDATE grants SET change_seq = :change_seq"),
+                {"change_seq": grant_version.next_version(db)}
+            )
         
         db.commit()
         
+        # Migration 5: Create indexes declared on the model but missing in the database
+        existing_indexes = {index['name'] for index in inspector.get_indexes('grants')}
+        for index in models.Grant.__table__.indexes:
+            if index.name not in existing_indexes:
+                index.create(bind=db.get_bind())
+                migrations_applied.append(f"Created index '{index.name}'")
+        
+        _grants_changed(db, "migrated")
+        
         if not migrations_applied:
             return {
                 "message": "Schema is already up to date. No migrations needed.",
@@ -419,11 +824,12 @@ def fix_null_deadlines(
         
         # Update grants with NULL deadlines
         db.execute(
-            text("UPDATE grants SET deadline = :deadline WHERE deadline IS NULL"),
-            {"deadline": default_deadline}
+            text("UPDATE grants SET deadline = :deadline, change_seq = :change_seq WHERE deadline IS NULL"),
+            {"deadline": default_deadline, "change_seq": grant_version.next_version(db)}
         )
         
         db.commit()
+        _grants_changed(db, "deadlines-fixed", affected=null_deadline_count)
         
         return {
             "message": f"Successfully fixed {null_deadline_count} grants with NULL deadlines",
@@ -547,6 +953,7 @@ def seed_database(
         db.add(grant)
     
     db.commit()
+    _grants_changed(db, "seeded", affected=len(grants_data))
     
     return {
         "message": "Database seeded successfully",
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 import os
 
@@ -7,145 +7,16 @@ from db import models
 from app.schemas import organization as schemas
 from app.api import deps
 from db.session import get_db
-from app.core.config import settings
+from app.core.cache import invalidate_user_principal
+from app.core.email_utils import build_approval_email, build_rejection_email
+from app.services.email_outbox import enqueue_email
+from app.services.event_bus import event_bus
 
 router = APIRouter(
     prefix="/organizations",
     tags=["organizations"]
 )
 
-def send_approval_email(email: str):
-    """Send approval email notification via Brevo API"""
-    print(f"[EMAIL] Attempting to send approval email to: {email}")
-    
-    # Brevo API endpoint
-    url = "https://api.brevo.com/v3/smtp/email"
-    
-    # Email content
-    html_content = f"""
-    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: auto; border: 1px solid #ddd; padding: 20px; border-radius: 10px;">
-        <h2 style="color: #17463a;">Congratulations!</h2>
-        <p>Your organization has been approved by the Relivo Admin team.</p>
-        <p>You can now log in to the Organization Portal and start accessing grant opportunities.</p>
-        <div style="margin-top: 30px;">
-            <a href="https://relivo-org-web.vercel.app/login" style="background: #17463a; color: white; padding: 12px 25px; text-decoration: none; border-radius: 5px; font-weight: bold;">Go to Login</a>
-        </div>
-        <p style="margin-top: 25px; font-size: 0.9em; color: #666;">If you have any questions, please contact our support team at <a href="mailto:muthukrishnan8733@gmail.com">muthukrishnan8733@gmail.com</a></p>
-        <p style="margin-top: 15px; font-size: 0.9em; color: #666;">Best regards,<br>The Relivo Team</p>
-    </div>
-    """
-    
-    payload = {
-        "sender": {
-            "name": "Relivo Admin",
-            "email": settings.MAIL_FROM
-        },
-        "to": [
-            {
-                "email": email
-            }
-        ],
-        "subject": "Relivo Organization Approved!",
-        "htmlContent": html_content
-    }
-    
-    headers = {
-        "accept": "application/json",
-        "api-key": settings.MAIL_PASSWORD,  # Brevo API key
-        "content-type": "application/json"
-    }
-    
-    try:
-        print(f"[EMAIL] Sending via Brevo API to: {email}")
-        import requests
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-        
-        if response.status_code in [200, 201]:
-            print(f"[EMAIL] ✓ Approval email sent successfully to {email}")
-            print(f"[EMAIL] Response: {response.json()}")
-            return True
-        else:
-            print(f"[EMAIL] ✗ Failed to send email. Status: {response.status_code}")
-            print(f"[EMAIL] Response: {response.text}")
-            return False
-    except Exception as e:
-        print(f"[EMAIL] ✗ Error sending approval email to {email}: {str(e)}")
-        print(f"[EMAIL] Error type: {type(e).__name__}")
-        import traceback
-        print(f"[EMAIL] Traceback: {traceback.format_exc()}")
-        return False
-
-def send_rejection_email(email: str, org_name: str, rejection_reason: str = None):
-    """Send rejection email via Brevo API"""
-    print(f"[EMAIL] Attempting to send rejection email to: {email} for org: {org_name}")
-    
-    # Brevo API endpoint
-    url = "https://api.brevo.com/v3/smtp/email"
-    
-    # Build the reason section if provided
-    reason_section = ""
-    if rejection_reason and rejection_reason.strip():
-        print(f"[EMAIL] Including rejection reason: {rejection_reason[:50]}...")
-        reason_section = f"""
-        <div style="background: #ffe6e6; padding: 15px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #d9534f;">
-            <p style="margin: 0 0 8px 0; color: #721c24; font-weight: bold;">Reason for rejection:</p>
-            <p style="margin: 0; color: #721c24;">{rejection_reason}</p>
-        </div>
-        """
-
-    html_content = f"""
-    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: auto; border: 1px solid #ddd; padding: 20px; border-radius: 10px;">
-        <h2 style="color: #d9534f;">Application Status Update</h2>
-        <p>Thank you for your interest in joining the Relivo platform.</p>
-        <p>After careful review, we regret to inform you that your organization application for <strong>{org_name}</strong> has not been approved at this time.</p>
-        {reason_section}
-        <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #ffc107;">
-            <p style="margin: 0; color: #856404;">If you believe this decision was made in error or would like to reapply with additional information, please contact our support team.</p>
-        </div>
-        <p style="margin-top: 25px; font-size: 0.9em; color: #666;">For support, please contact: <a href="mailto:muthukrishnan8733@gmail.com">muthukrishnan8733@gmail.com</a></p>
-        <p style="margin-top: 15px; font-size: 0.9em; color: #666;">Best regards,<br>The Relivo Team</p>
-    </div>
-    """
-    
-    payload = {
-        "sender": {
-            "name": "Relivo Admin",
-            "email": settings.MAIL_FROM
-        },
-        "to": [
-            {
-                "email": email
-            }
-        ],
-        "subject": "Relivo Organization Application Update",
-        "htmlContent": html_content
-    }
-    
-    headers = {
-        "accept": "application/json",
-        "api-key": settings.MAIL_PASSWORD,  # Brevo API key
-        "content-type": "application/json"
-    }
-
-    try:
-        print(f"[EMAIL] Sending via Brevo API to: {email}")
-        import requests
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-        
-        if response.status_code in [200, 201]:
-            print(f"[EMAIL] ✓ Rejection email sent successfully to {email}")
-            print(f"[EMAIL] Response: {response.json()}")
-            return True
-        else:
-            print(f"[EMAIL] ✗ Failed to send email. Status: {response.status_code}")
-            print(f"[EMAIL] Response: {response.text}")
-            return False
-    except Exception as e:
-        print(f"[EMAIL] ✗ Error sending rejection email to {email}: {str(e)}")
-        import traceback
-        print(f"[EMAIL] Traceback: {traceback.format_exc()}")
-        return False
-
 @router.get("/admin/all", response_model=List[schemas.Organization])
 def get_all_organizations(
     db: Session = Depends(get_db),
@@ -174,7 +45,6 @@ def get_pending_organizations(
 @router.post("/admin/{org_id}/approve")
 def approve_organization(
     org_id: int,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(deps.get_current_admin_user)
 ):
@@ -191,18 +61,22 @@ def approve_organization(
         user.is_active = True
         user.role = "organization"
     
-    db.commit()
+    # Queue approval email (sent once committed); outbox rows need a recipient
+    if org.contact_email:
+        enqueue_email(db, build_approval_email(org.contact_email))
     
-    # Send approval email in background
-    background_tasks.add_task(send_approval_email, org.contact_email)
+    db.commit()
+    invalidate_user_principal(org.user_id)
+    event_bus.publish("organization", db=db, action="approved", id=org_id, status="approved")
     
+    if not org.contact_email:
+        return {"message": "Organization approved (no contact email, notification not sent)", "email": None}
     return {"message": "Organization approved and notification sent", "email": org.contact_email}
 
 @router.post("/admin/{org_id}/reject")
 def reject_organization(
     org_id: int,
     rejection_data: dict,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(deps.get_current_admin_user)
 ):
@@ -222,11 +96,16 @@ def reject_organization(
     if user:
         user.is_active = False
     
-    db.commit()
+    # Queue rejection email with reason (sent once committed); outbox rows need a recipient
+    if org.contact_email:
+        enqueue_email(db, build_rejection_email(org.contact_email, org.name, rejection_reason))
     
-    # Send rejection email in background with reason
-    background_tasks.add_task(send_rejection_email, org.contact_email, org.name, rejection_reason)
+    db.commit()
+    invalidate_user_principal(org.user_id)
+    event_bus.publish("organization", db=db, action="rejected", id=org_id, status="rejected")
     
+    if not org.contact_email:
+        return {"message": "Organization rejected (no contact email, notification not sent)", "email": None}
     return {"message": "Organization rejected and notification sent", "email": org.contact_email}
 
 
@@ -243,6 +122,7 @@ def suspend_organization(
     
     org.status = "suspended"
     db.commit()
+    event_bus.publish("organization", db=db, action="suspended", id=org_id, status="suspended")
     return {"message": "Organization suspended"}
 
 @router.put("/admin/{org_id}/reactivate")
@@ -264,4 +144,6 @@ def reactivate_organization(
         user.is_active = True
     
     db.commit()
+    invalidate_user_principal(org.user_id)
+    event_bus.publish("organization", db=db, action="reactivated", id=org_id, status="approved")
     return {"message": "Organization reactivated"}
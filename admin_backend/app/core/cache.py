@@ -0,0 +1,101 @@
+"""
+In-process caches
+
+Small thread-safe TTL + LRU cache used for hot read paths, plus the shared
+cache instances and their invalidation hooks.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after ``ttl`` seconds.
+
+    ``generation`` is bumped on every invalidation. Readers capture it before
+    building a value and pass it to ``set`` so a value computed from data that
+    was invalidated mid-build is never stored.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: int = None):
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            self.generation += 1
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Serialized JSON bodies of grant list pages, keyed by (endpoint, params..., grants
+# table version); a hit still reads the version row (see grants._grant_list_page)
+grant_list_cache = TTLCache(
+    maxsize=settings.GRANT_CACHE_MAX_ENTRIES,
+    ttl=settings.GRANT_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_grant_caches():
+    """Drop every cached grant read; call after any write to the grants table"""
+    grant_list_cache.clear()
+
+
+# Authenticated user principals (app.api.deps.Principal), keyed by user id
+user_principal_cache = TTLCache(
+    maxsize=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_user_principal(user_id: int):
+    """Drop a cached principal; call after changing a user's role, status or profile"""
+    user_principal_cache.pop(user_id)
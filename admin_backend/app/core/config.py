@@ -10,9 +10,26 @@ load_dotenv(dotenv_path=env_path)
 class Settings:
     PROJECT_NAME: str = "Refugee App Backend"
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "false").lower() == "true"  # Serve grants/organizations on asyncpg/aiosqlite
+
+    # Connection pool
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 30))  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 3600))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    SQLITE_POOL: str = os.getenv("SQLITE_POOL", "queue")  # queue, static or null
+    SQLITE_WAL: bool = os.getenv("SQLITE_WAL", "true").lower() == "true"
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 1440))
+
+    # Password hashing (Argon2id). Changing the cost rehashes users on their next login.
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", 3))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", 65536))  # KiB
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", 4))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))  # Beyond this, 503
     
     SMTP_SERVER: str = os.getenv("SMTP_SERVER", "smtp.gmail.com")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", 587))
@@ -26,4 +43,54 @@ class Settings:
     MAIL_PORT: int = int(os.getenv("MAIL_PORT", 587))
     MAIL_FROM: str = os.getenv("MAIL_FROM")
 
+    # Outbound email dispatcher
+    EMAIL_TRANSPORT: str = os.getenv("EMAIL_TRANSPORT", "brevo")  # or "log"
+    EMAIL_API_URL: str = os.getenv("EMAIL_API_URL", "https://api.brevo.com/v3/smtp/email")
+    EMAIL_BATCH_SIZE: int = int(os.getenv("EMAIL_BATCH_SIZE", 50))
+
+    # Durable email outbox
+    EMAIL_OUTBOX_DRAINER: bool = os.getenv("EMAIL_OUTBOX_DRAINER", "true").lower() == "true"  # false if drained by a separate process
+    EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 100))
+    EMAIL_OUTBOX_CONCURRENCY: int = int(os.getenv("EMAIL_OUTBOX_CONCURRENCY", 4))
+    EMAIL_OUTBOX_POLL_INTERVAL: float = float(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL", 1.0))
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+    EMAIL_OUTBOX_RETRY_BACKOFF: float = float(os.getenv("EMAIL_OUTBOX_RETRY_BACKOFF", 30))  # Seconds, doubled per attempt
+    EMAIL_OUTBOX_CLAIM_TIMEOUT: float = float(os.getenv("EMAIL_OUTBOX_CLAIM_TIMEOUT", 300))  # Reclaim rows stuck in "sending"
+
+    # Grants.gov import
+    GRANTS_IMPORT_WORKERS: int = int(os.getenv("GRANTS_IMPORT_WORKERS", 1))  # >1 extracts in a process pool
+    GRANTS_IMPORT_LOCAL_FILES: bool = os.getenv("GRANTS_IMPORT_LOCAL_FILES", "false").lower() == "true"  # Let the import endpoint read server-side paths / file:// URLs
+    GRANTS_CATEGORY_RULES_FILE: str = os.getenv("GRANTS_CATEGORY_RULES_FILE")  # JSON {"Category": [keywords]}
+    GRANTS_CATEGORY_STRATEGY: str = os.getenv("GRANTS_CATEGORY_STRATEGY", "first_match")  # or "score"
+
+    # Grant list response cache
+    GRANT_CACHE_TTL_SECONDS: float = float(os.getenv("GRANT_CACHE_TTL_SECONDS", 30))
+    GRANT_CACHE_MAX_ENTRIES: int = int(os.getenv("GRANT_CACHE_MAX_ENTRIES", 256))
+
+    # Authenticated user principal cache (0 disables)
+    AUTH_USER_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", 60))
+    AUTH_USER_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", 1024))
+
+    # Dashboard statistics
+    GRANT_STATS_SUMMARY: bool = os.getenv("GRANT_STATS_SUMMARY", "false").lower() == "true"  # Materialize into grant_stats_summary
+    GRANT_STATS_SUMMARY_MAX_AGE: int = int(os.getenv("GRANT_STATS_SUMMARY_MAX_AGE", 3600))  # Seconds before a read recomputes
+
+    # Live moderation events (Server-Sent Events)
+    EVENT_BUS_BACKEND: str = os.getenv("EVENT_BUS_BACKEND", "local")  # "postgres" fans out across workers via LISTEN/NOTIFY
+    EVENT_BUS_CHANNEL: str = os.getenv("EVENT_BUS_CHANNEL", "relivo_events")
+    EVENT_STREAM_QUEUE_MAX: int = int(os.getenv("EVENT_STREAM_QUEUE_MAX", 100))  # Per stream; a slower client gets "resync"
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = float(os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", 15))
+
+    # Response compression
+    GZIP_MIN_SIZE: int = int(os.getenv("GZIP_MIN_SIZE", 1024))  # Bytes; smaller bodies are sent as-is
+    GZIP_LEVEL: int = int(os.getenv("GZIP_LEVEL", 6))
+
+    # Request instrumentation (Prometheus /metrics, Server-Timing, slow request log)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    SERVER_TIMING: bool = os.getenv("SERVER_TIMING", "false").lower() == "true"  # Exposes DB timings to clients; enable for staging/debugging
+    SLOW_REQUEST_MS: float = float(os.getenv("SLOW_REQUEST_MS", 1000))  # 0 disables the slow request log
+    SLOW_REQUEST_SAMPLE_RATE: float = float(os.getenv("SLOW_REQUEST_SAMPLE_RATE", 1.0))  # Fraction of slow requests logged with their SQL
+    SLOW_REQUEST_MAX_STATEMENTS: int = int(os.getenv("SLOW_REQUEST_MAX_STATEMENTS", 50))  # SQL kept per request for the log
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")  # Bearer token for scrapers; unset = /metrics* need an admin login
+
 settings = Settings()
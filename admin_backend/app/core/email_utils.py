@@ -1,36 +1,14 @@
-import requests
-import json
-from app.core.config import settings
+from app.services.email_dispatcher import EmailMessage
 
-def send_verification_email(email_to: str, code: str, subject: str = "Your Verification Code - Relivo", heading: str = "Verification Code"):
-    print(f"DEBUG: Attempting to send email via Brevo API to {email_to}")
-    
-    url = "https://api.brevo.com/v3/smtp/email"
-    
-    # The API Key is stored in MAIL_PASSWORD env var based on USER configuration
-    # Assuming 'xkeysib-...' is the API key.
-    api_key = settings.MAIL_PASSWORD
-    
-    if not api_key:
-        print("[ERROR] No API Key (MAIL_PASSWORD) found.")
-        return False
-        
-    sender_email = settings.MAIL_FROM or "no-reply@relivo.app"
-    sender_name = "Relivo App"
-    
-    # Construct Payload
-    payload = {
-        "sender": {
-            "name": sender_name,
-            "email": sender_email
-        },
-        "to": [
-            {
-                "email": email_to
-            }
-        ],
-        "subject": subject,
-        "htmlContent": f"""
+# Emails are rendered here; callers add them to the email outbox
+# (app.services.email_outbox.enqueue_email), which delivers them.
+
+def build_verification_email(email_to: str, code: str, subject: str = "Your Verification Code - Relivo", heading: str = "Verification Code") -> EmailMessage:
+    return EmailMessage(
+        to=email_to,
+        subject=subject,
+        sender_name="Relivo App",
+        html_content=f"""
         <html>
             <body style="font-family: Arial, sans-serif;">
                 <div style="padding: 20px; background-color: #f4f4f4; border-radius: 10px;">
@@ -42,25 +20,58 @@ def send_verification_email(email_to: str, code: str, subject: str = "Your Verif
             </body>
         </html>
         """
-    }
+    )
+
+def build_approval_email(email: str) -> EmailMessage:
+    html_content = f"""
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: auto; border: 1px solid #ddd; padding: 20px; border-radius: 10px;">
+        <h2 style="color: #17463a;">Congratulations!</h2>
+        <p>Your organization has been approved by the Relivo Admin team.</p>
+        <p>You can now log in to the Organization Portal and start accessing grant opportunities.</p>
+        <div style="margin-top: 30px;">
+            <a href="https://relivo-org-web.vercel.app/login" style="background: #17463a; color: white; padding: 12px 25px; text-decoration: none; border-radius: 5px; font-weight: bold;">Go to Login</a>
+        </div>
+        <p style="margin-top: 25px; font-size: 0.9em; color: #666;">If you have any questions, please contact our support team at <a href="mailto:muthukrishnan8733@gmail.com">muthukrishnan8733@gmail.com</a></p>
+        <p style="margin-top: 15px; font-size: 0.9em; color: #666;">Best regards,<br>The Relivo Team</p>
+    </div>
+    """
     
-    headers = {
-        'accept': 'application/json',
-        'api-key': api_key,
-        'content-type': 'application/json'
-    }
+    return EmailMessage(
+        to=email,
+        subject="Relivo Organization Approved!",
+        sender_name="Relivo Admin",
+        html_content=html_content
+    )
+
+def build_rejection_email(email: str, org_name: str, rejection_reason: str = None) -> EmailMessage:
+    # Build the reason section if provided
+    reason_section = ""
+    if rejection_reason and rejection_reason.strip():
+        print(f"[EMAIL] Including rejection reason: {rejection_reason[:50]}...")
+        reason_section = f"""
+        <div style="background: #ffe6e6; padding: 15px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #d9534f;">
+            <p style="margin: 0 0 8px 0; color: #721c24; font-weight: bold;">Reason for rejection:</p>
+            <p style="margin: 0; color: #721c24;">{rejection_reason}</p>
+        </div>
+        """
+
+    html_content = f"""
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: auto; border: 1px solid #ddd; padding: 20px; border-radius: 10px;">
+        <h2 style="color: #d9534f;">Application Status Update</h2>
+        <p>Thank you for your interest in joining the Relivo platform.</p>
+        <p>After careful review, we regret to inform you that your organization application for <strong>{org_name}</strong> has not been approved at this time.</p>
+        {reason_section}
+        <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #ffc107;">
+            <p style="margin: 0; color: #856404;">If you believe this decision was made in error or would like to reapply with additional information, please contact our support team.</p>
+        </div>
+        <p style="margin-top: 25px; font-size: 0.9em; color: #666;">For support, please contact: <a href="mailto:muthukrishnan8733@gmail.com">muthukrishnan8733@gmail.com</a></p>
+        <p style="margin-top: 15px; font-size: 0.9em; color: #666;">Best regards,<br>The Relivo Team</p>
+    </div>
+    """
     
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
-        
-        if response.status_code == 201 or response.status_code == 200:
-            print(f"[SUCCESS] Email sent successfully via Brevo API. Response: {response.text}")
-            return True
-        else:
-            print(f"[ERROR] Failed to send email via Brevo API. Status: {response.status_code}")
-            print(f"[ERROR] Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"[ERROR] Exception sending email via API: {str(e)}")
-        return False
+    return EmailMessage(
+        to=email,
+        subject="Relivo Organization Application Update",
+        sender_name="Relivo Admin",
+        html_content=html_content
+    )
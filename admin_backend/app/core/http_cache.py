@@ -0,0 +1,68 @@
+"""
+Conditional and compressed responses
+
+Helpers for serving cacheable JSON bodies: strong ETags, If-None-Match
+handling (304 Not Modified) and gzip bodies that are compressed once and
+then reused from the response cache.
+"""
+
+import gzip
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+
+# Private: responses depend on the caller's credentials; no-cache: always revalidate
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(version: int, key: tuple, encoding: Optional[str] = None) -> str:
+    """
+    Strong ETag for the representation of ``key`` at a data ``version``.
+    Each content encoding is a different representation, so it gets its own tag.
+    """
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+    tag = f"v{version}-{digest}"
+    if encoding:
+        tag += f"-{encoding}"
+    return f'"{tag}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match lists ``etag`` (or is ``*``)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        # If-None-Match uses the weak comparison function
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def compress(body: bytes) -> Optional[bytes]:
+    """gzip ``body``, or None when it is too small to be worth it"""
+    if len(body) < settings.GZIP_MIN_SIZE:
+        return None
+    return gzip.compress(body, compresslevel=settings.GZIP_LEVEL)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    })
@@ -0,0 +1,287 @@
+"""
+Request instrumentation
+
+An ASGI middleware plus SQLAlchemy cursor events that measure, per request:
+
+- latency, by method and route template (histogram per route)
+- database time and statement count (before/after_cursor_execute)
+- threadpool queue time: from arrival until the first sync dependency
+  (get_db) starts running in a worker thread
+- response size on the wire (after compression)
+
+Totals are exported in Prometheus text format by GET /metrics (admin login,
+or METRICS_TOKEN for scrapers). With SERVER_TIMING enabled each response
+also carries a Server-Timing header. Requests slower than SLOW_REQUEST_MS
+are sampled (SLOW_REQUEST_SAMPLE_RATE) and logged together with the SQL
+they ran.
+"""
+
+import contextvars
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import anyio.to_thread
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+
+logger = logging.getLogger("app.slow_requests")
+
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+BYTE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class RequestStats:
+    """Measurements for the request being handled (one per request, via a context variable)"""
+
+    __slots__ = ("started", "db_ms", "statements", "sql", "queue_ms")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_ms = 0.0
+        self.statements = 0
+        self.sql: List[Tuple[str, float]] = []
+        self.queue_ms: Optional[float] = None
+
+
+_current: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def mark_threadpool_start():
+    """Record threadpool queue time; call first thing in a sync dependency"""
+    stats = _current.get()
+    if stats is not None and stats.queue_ms is None:
+        stats.queue_ms = (time.perf_counter() - stats.started) * 1000
+
+
+# ----------------------------------------------------------------------
+# Aggregates
+# ----------------------------------------------------------------------
+
+class RouteMetrics:
+    def __init__(self):
+        self.latency_ms = Histogram()
+        self.requests_by_status: Dict[str, Counter] = {}
+        self.db_ms_total = 0.0
+        self.statements_total = 0
+        self.response_bytes_total = 0
+        self._lock = threading.Lock()
+
+    def record(self, status: int, latency_ms: float, stats: RequestStats, response_bytes: int):
+        self.latency_ms.observe(latency_ms)
+        status_class = f"{status // 100}xx"
+        with self._lock:
+            counter = self.requests_by_status.setdefault(status_class, Counter())
+            self.db_ms_total += stats.db_ms
+            self.statements_total += stats.statements
+            self.response_bytes_total += response_bytes
+        counter.inc()
+
+
+_routes: Dict[Tuple[str, str], RouteMetrics] = {}
+_routes_lock = threading.Lock()
+
+db_ms_per_request = Histogram()
+statements_per_request = Histogram(buckets=STATEMENT_BUCKETS)
+queue_ms_per_request = Histogram()
+response_bytes = Histogram(buckets=BYTE_BUCKETS)
+statement_latency_ms = Histogram()
+slow_requests = Counter()
+
+
+def _route_metrics(method: str, route: str) -> RouteMetrics:
+    key = (method, route)
+    metrics = _routes.get(key)
+    if metrics is None:
+        with _routes_lock:
+            metrics = _routes.setdefault(key, RouteMetrics())
+    return metrics
+
+
+# ----------------------------------------------------------------------
+# SQLAlchemy events
+# ----------------------------------------------------------------------
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+    statement_latency_ms.observe(elapsed_ms)
+    stats = _current.get()
+    if stats is not None:
+        stats.db_ms += elapsed_ms
+        stats.statements += 1
+        if len(stats.sql) < settings.SLOW_REQUEST_MAX_STATEMENTS:
+            stats.sql.append((statement, elapsed_ms))
+
+
+def attach_query_metrics(engine: Engine):
+    """Time every statement on ``engine`` (pass async_engine.sync_engine for the async engine)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ----------------------------------------------------------------------
+# Middleware
+# ----------------------------------------------------------------------
+
+class InstrumentationMiddleware:
+    """Pure ASGI middleware, so streaming responses and context variables are unaffected"""
+
+    def __init__(self, app, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [
+                        (b"server-timing", _server_timing(stats).encode("latin-1"))
+                    ]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            latency_ms = (time.perf_counter() - stats.started) * 1000
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            _route_metrics(scope["method"], route_path).record(status, latency_ms, stats, size)
+            db_ms_per_request.observe(stats.db_ms)
+            statements_per_request.observe(stats.statements)
+            response_bytes.observe(size)
+            if stats.queue_ms is not None:
+                queue_ms_per_request.observe(stats.queue_ms)
+            if settings.SLOW_REQUEST_MS and latency_ms >= settings.SLOW_REQUEST_MS:
+                slow_requests.inc()
+                if random.random() < settings.SLOW_REQUEST_SAMPLE_RATE:
+                    _log_slow_request(scope, route_path, status, latency_ms, stats)
+
+
+def _server_timing(stats: RequestStats) -> str:
+    app_ms = (time.perf_counter() - stats.started) * 1000
+    parts = [
+        f"app;dur={app_ms:.1f}",
+        f'db;dur={stats.db_ms:.1f};desc="{stats.statements} statements"',
+    ]
+    if stats.queue_ms is not None:
+        parts.append(f"queue;dur={stats.queue_ms:.1f}")
+    return ", ".join(parts)
+
+
+def _log_slow_request(scope, route_path: str, status: int, latency_ms: float, stats: RequestStats):
+    lines = [
+        f"Slow request {scope['method']} {scope['path']} ({route_path}) -> {status}: "
+        f"{latency_ms:.1f} ms, db {stats.db_ms:.1f} ms in {stats.statements} statements, "
+        f"queue {stats.queue_ms or 0:.1f} ms"
+    ]
+    for statement, elapsed_ms in stats.sql:
+        lines.append(f"  [{elapsed_ms:.1f} ms] {' '.join(statement.split())}")
+    if stats.statements > len(stats.sql):
+        lines.append(f"  ... {stats.statements - len(stats.sql)} more statements")
+    logger.warning("\n".join(lines))
+
+
+# ----------------------------------------------------------------------
+# Prometheus exposition
+# ----------------------------------------------------------------------
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels) -> List[str]:
+    snapshot = histogram.snapshot()
+    lines = []
+    for bound, count in snapshot["buckets"].items():
+        lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {snapshot['sum']}")
+    lines.append(f"{name}_count{_labels(**labels)} {snapshot['count']}")
+    return lines
+
+
+def _header(name: str, kind: str, help_text: str) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+
+def render_prometheus() -> str:
+    """All request metrics in Prometheus text exposition format (0.0.4)"""
+    with _routes_lock:
+        routes = sorted(_routes.items())
+
+    lines = _header("http_request_duration_milliseconds", "histogram", "Request latency by route")
+    for (method, route), metrics in routes:
+        lines += _histogram_lines("http_request_duration_milliseconds", metrics.latency_ms, method=method, route=route)
+
+    lines += _header("http_requests_total", "counter", "Requests by route and status class")
+    for (method, route), metrics in routes:
+        with metrics._lock:
+            by_status = sorted((status, counter.value) for status, counter in metrics.requests_by_status.items())
+        for status, count in by_status:
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+    per_route_totals = (
+        ("http_request_db_milliseconds_total", "db_ms_total", "Database time spent by route"),
+        ("http_request_db_statements_total", "statements_total", "SQL statements executed by route"),
+        ("http_response_bytes_total", "response_bytes_total", "Response bytes sent by route"),
+    )
+    for name, attribute, help_text in per_route_totals:
+        lines += _header(name, "counter", help_text)
+        for (method, route), metrics in routes:
+            lines.append(f"{name}{_labels(method=method, route=route)} {round(getattr(metrics, attribute), 3)}")
+
+    for name, histogram, help_text in (
+        ("http_request_db_time_milliseconds", db_ms_per_request, "Database time per request"),
+        ("http_request_db_statements", statements_per_request, "SQL statements per request"),
+        ("http_request_threadpool_queue_milliseconds", queue_ms_per_request, "Wait for a worker thread per request"),
+        ("http_response_size_bytes", response_bytes, "Response size per request"),
+        ("db_statement_duration_milliseconds", statement_latency_ms, "Latency of individual SQL statements"),
+    ):
+        lines += _header(name, "histogram", help_text)
+        lines += _histogram_lines(name, histogram)
+
+    lines += _header("http_slow_requests_total", "counter", f"Requests slower than {settings.SLOW_REQUEST_MS} ms")
+    lines.append(f"http_slow_requests_total {slow_requests.value}")
+
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    lines += _header("threadpool_threads_busy", "gauge", "Worker threads running sync endpoints and dependencies")
+    lines.append(f"threadpool_threads_busy {limiter.borrowed_tokens}")
+    lines += _header("threadpool_threads_max", "gauge", "Worker thread limit")
+    lines.append(f"threadpool_threads_max {limiter.total_tokens}")
+    lines += _header("threadpool_tasks_waiting", "gauge", "Tasks queued for a worker thread")
+    lines.append(f"threadpool_tasks_waiting {limiter.statistics().tasks_waiting}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,61 @@
+"""
+Lightweight in-process metrics
+
+Thread-safe counters and fixed-bucket histograms, exported as plain dicts
+by the /metrics endpoints. No external metrics dependency.
+"""
+
+import bisect
+import threading
+from typing import Sequence
+
+# Millisecond buckets suited to DB and request latencies
+DEFAULT_MS_BUCKETS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus style) of observed values"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_MS_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._sum += value
+            self._count += 1
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self.buckets, self._counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            buckets["+Inf"] = self._count
+            return {
+                "count": self._count,
+                "sum": round(self._sum, 3),
+                "avg": round(self._sum / self._count, 3) if self._count else 0.0,
+                "max": round(self._max, 3),
+                "buckets": buckets,
+            }
+
+
+class Counter:
+    """Thread-safe monotonically increasing counter"""
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
@@ -0,0 +1,66 @@
+"""
+Keyset (cursor) pagination helpers
+
+Cursors are opaque URL-safe tokens holding the sort key of the last row of
+the previous page, so the database can seek straight to the next page via a
+composite index instead of scanning and discarding OFFSET rows.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(*values: Any) -> str:
+    """Pack sort-key values (datetimes, ints, strings) into an opaque cursor"""
+    payload = [
+        {"dt": v.isoformat()} if isinstance(v, datetime) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Unpack a cursor produced by encode_cursor; 400 if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return [
+            datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v
+            for v in payload
+        ]
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def apply_keyset(query: Query, sort_column, id_column, cursor: Optional[str], descending: bool = True) -> Query:
+    """
+    Restrict ``query`` to rows after ``cursor`` in (sort_column, id_column) order.
+
+    The caller must order by the same two columns in the same direction, and
+    the sort column must not be NULL (e.g. created_at with a server default).
+    """
+    if not cursor:
+        return query
+
+    values = decode_cursor(cursor)
+    if len(values) != 2 or values[0] is None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    last_value, last_id = values
+
+    # SQLite stores server-default timestamps without microseconds while bound
+    # datetimes carry them, so compare on julianday() to get a true equality.
+    column = sort_column
+    if query.session.get_bind().dialect.name == "sqlite" and isinstance(last_value, datetime):
+        column = func.julianday(sort_column)
+        last_value = func.julianday(last_value)
+
+    if descending:
+        return query.filter(or_(column < last_value, and_(column == last_value, id_column < last_id)))
+    return query.filter(or_(column > last_value, and_(column == last_value, id_column > last_id)))
@@ -1,18 +1,30 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union, Any
+from typing import Optional, Tuple, Union, Any
+from fastapi import HTTPException
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.metrics import Counter, Histogram
 
 # Changed to Argon2 for better security and stability
-pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__rounds=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 def create_access_token(subject: Union[str, Any], user_id: int, role: str, expires_delta: Optional[timedelta] = None) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
+
     to_encode = {
         "sub": str(subject),
         "user_id": user_id,
@@ -27,3 +39,85 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHashingExecutor:
+    """
+    Bounded pool for Argon2 hashing, awaited from async handlers.
+
+    argon2-cffi releases the GIL, so a thread pool gives real parallelism
+    without pickling overhead. Capping the workers keeps a login burst from
+    taking every core away from the other endpoints; requests beyond the
+    workers wait here (not in the request threadpool), and beyond
+    ``max_queue`` waiting requests new ones are rejected with 503.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.peak_pending = 0
+        self.rejected = Counter()
+        self.rehashed = Counter()
+        self.queue_wait_ms = Histogram()
+        self.hash_time_ms = Histogram()
+
+    async def _submit(self, func, *args):
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.rejected.inc()
+                raise HTTPException(status_code=503, detail="Server busy, please retry")
+            self._pending += 1
+            self.peak_pending = max(self.peak_pending, self._pending)
+
+        submitted = time.perf_counter()
+
+        def run():
+            started = time.perf_counter()
+            self.queue_wait_ms.observe((started - submitted) * 1000)
+            try:
+                return func(*args)
+            finally:
+                self.hash_time_ms.observe((time.perf_counter() - started) * 1000)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password; also returns a new hash when the stored one uses
+        outdated parameters or a deprecated scheme (rehash-on-login).
+        """
+        valid, new_hash = await self._submit(pwd_context.verify_and_update, password, hashed_password)
+        if new_hash:
+            self.rehashed.inc()
+        return valid, new_hash
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = self._pending
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(pending, self.workers),
+            "queued": max(pending - self.workers, 0),
+            "peak_pending": self.peak_pending,
+            "rejected": self.rejected.value,
+            "rehashed": self.rehashed.value,
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+            "hash_time_ms": self.hash_time_ms.snapshot(),
+        }
+
+
+password_hasher = PasswordHashingExecutor(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
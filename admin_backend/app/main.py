@@ -1,8 +1,11 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import logging
 
 from app.api import auth
+from app.api.deps import get_metrics_access
+from app.core.config import settings
 from db.session import engine, Base
 import db.models # Import models to ensure they are registered with Base
 
@@ -19,8 +22,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# Compress other large responses; grant list pages arrive pre-compressed from the cache
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MIN_SIZE, compresslevel=settings.GZIP_LEVEL)
+
+# Outermost, so timings cover the whole stack and sizes are measured after compression
+if settings.METRICS_ENABLED:
+    from app.core.instrumentation import InstrumentationMiddleware
+    app.add_middleware(InstrumentationMiddleware, server_timing=settings.SERVER_TIMING)
+
 # Startup event to create tables
 @app.on_event("startup")
 async def startup_event():
@@ -33,12 +45,50 @@ async def startup_event():
         logger.error(f"❌ Error creating tables: {e}")
         # Don't crash the app, tables might already exist
         logger.warning("Continuing without creating tables - they may already exist")
+    
+    try:
+        from app.services.grant_version import ensure_version_row
+        ensure_version_row(engine)
+    except Exception as e:
+        # next_version() creates the row on the first grant write instead
+        logger.error(f"❌ Error creating grants table version row: {e}")
+    
+    if settings.EMAIL_OUTBOX_DRAINER:
+        from app.services.email_outbox import email_outbox_drainer
+        email_outbox_drainer.start()
+    
+    from app.services.event_bus import event_bus
+    event_bus.start()
+    
+    try:
+        from app.services.grant_search import ensure_search_index
+        ensure_search_index(engine)
+        logger.info("✅ Grant search index ready")
+    except Exception as e:
+        # Search falls back to substring matching without the index
+        logger.error(f"❌ Error creating search index: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.services.email_outbox import email_outbox_drainer
+    from app.services.event_bus import event_bus
+    event_bus.stop()
+    email_outbox_drainer.stop()
+    if settings.DB_ASYNC:
+        from db.async_session import async_engine
+        await async_engine.dispose()
 
 # Include routers
 app.include_router(auth.router)
-from app.api import grants, organizations
-app.include_router(grants.router)
-app.include_router(organizations.router)
+from app.api import grants, organizations, events
+if settings.DB_ASYNC:
+    from app.api.async_routes import asyncify_router
+    app.include_router(asyncify_router(grants.router))
+    app.include_router(asyncify_router(organizations.router))
+else:
+    app.include_router(grants.router)
+    app.include_router(organizations.router)
+app.include_router(events.router)  # Async streaming endpoint; holds no database session
 
 @app.get("/")
 async def root():
@@ -63,6 +113,54 @@ async def health_check():
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
 
+@app.get("/metrics", dependencies=[Depends(get_metrics_access)])
+async def prometheus_metrics():
+    """Per-route latency, DB time, statement counts, queue time and response sizes (Prometheus text format)"""
+    from fastapi.responses import PlainTextResponse
+    from app.core.instrumentation import render_prometheus
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/metrics/pool", dependencies=[Depends(get_metrics_access)])
+async def pool_metrics():
+    """Connection pool occupancy, overflow and checkout timings"""
+    from db.pool import pool_status
+    return pool_status()
+
+
+@app.get("/metrics/hashing", dependencies=[Depends(get_metrics_access)])
+async def hashing_metrics():
+    """Password hashing pool occupancy, queue wait and hash timings"""
+    from app.core.security import password_hasher
+    return password_hasher.stats()
+
+
+@app.get("/metrics/email", dependencies=[Depends(get_metrics_access)])
+async def email_metrics():
+    """Email dispatcher throughput, failures and provider latency"""
+    from app.services.email_dispatcher import email_dispatcher
+    return email_dispatcher.stats()
+
+
+@app.get("/metrics/events", dependencies=[Depends(get_metrics_access)])
+async def event_metrics():
+    """Event bus subscribers and publish/delivery counts"""
+    from app.services.event_bus import event_bus
+    return event_bus.stats()
+
+
+@app.get("/metrics/outbox", dependencies=[Depends(get_metrics_access)])
+def outbox_metrics():
+    """Email outbox backlog, lag and drain throughput"""
+    from app.services.email_outbox import email_outbox_drainer
+    from db.session import SessionLocal
+    db = SessionLocal()
+    try:
+        return email_outbox_drainer.stats(db)
+    finally:
+        db.close()
+
+
 @app.get("/migrate-database")
 async def migrate_database_public():
     """
@@ -117,6 +215,7 @@ async def migrate_database_public():
             'organization_id': 'INTEGER',
             'eligibility_criteria': 'JSON',
             'required_documents': 'JSON',
+            'change_seq': 'INTEGER NOT NULL DEFAULT 0',
         }
         
         for column_name, column_type in column_definitions.items():
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 class GrantBase(BaseModel):
@@ -61,5 +61,58 @@ class GrantImportResult(BaseModel):
     """Result of Grants.gov import operation"""
     imported: int
     skipped: int
+    unchanged: int = 0  # Skipped because the content fingerprint matched the last import
+    not_modified: bool = False  # Extract itself was unchanged (HTTP 304), nothing downloaded
     errors: List[str] = []
 
+class ImportJobStatus(BaseModel):
+    """Progress of a background Grants.gov import"""
+    job_id: str
+    status: str  # queued, running, succeeded, failed
+    phase: str  # pending, downloading, parsing, importing, done, failed
+    xml_url: Optional[str] = None
+    incremental: bool = True
+    deduplicated: bool = False  # True when an already-running job was returned
+    rows_processed: int = 0
+    imported: int = 0
+    skipped: int = 0
+    unchanged: int = 0
+    not_modified: bool = False
+    errors: List[str] = []
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+    stage_seconds: Dict[str, float] = {}  # download, unzip, parse, extract, classify, db_write
+
+class GrantBulkFilter(BaseModel):
+    """Set-based grant selection for bulk moderation; all given fields must match"""
+    is_verified: Optional[bool] = None
+    is_active: Optional[bool] = None
+    source: Optional[str] = None
+    refugee_country: Optional[str] = None
+    category: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+class GrantBulkAction(BaseModel):
+    """Target grants by explicit ids, by filter, or both (intersection)"""
+    ids: Optional[List[int]] = None
+    filter: Optional[GrantBulkFilter] = None
+
+class GrantBulkSetFields(GrantBulkAction):
+    """Bulk reassignment of country and/or category"""
+    refugee_country: Optional[str] = None
+    category: Optional[str] = None
+
+class GrantBulkResult(BaseModel):
+    action: str
+    affected: int
+
+class GrantChanges(BaseModel):
+    """A page of the grant change feed: apply ``deleted``, then upsert ``upserted`` by id"""
+    upserted: List[Grant]
+    deleted: List[int]  # Grant ids
+    next_token: str  # Pass as ``since`` on the next call
+    has_more: bool  # True while the feed has more changes up to the version read at request time
@@ -0,0 +1,118 @@
+"""
+Grant Category Classifier
+
+Assigns a category to a grant from its free text. The keyword table is
+configurable and compiled once per process into one of two strategies:
+
+- "first_match" (default): categories are tried in table order and the
+  first one with a keyword substring wins. Each check is a C-level
+  ``in`` scan, which is the cheapest option on CPython.
+- "score": a single word-boundary regex over all keywords counts hits per
+  category in one pass; the highest score wins and table order breaks ties.
+  More accurate ("network" no longer means Employment) but slower on long
+  descriptions; see benchmark_category_classifier.py.
+"""
+
+import json
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+# Category -> keywords. Order is the priority used by both strategies.
+DEFAULT_CATEGORY_RULES: Dict[str, List[str]] = {
+    'Housing': ['housing', 'shelter', 'accommodation'],
+    'Education': ['education', 'training', 'school', 'university', 'curriculum'],
+    'Healthcare': ['health', 'medical', 'healthcare', 'disease', 'vaccine'],
+    'Employment': ['employment', 'job', 'business', 'entrepreneur', 'work'],
+    'Legal': ['legal', 'reunification', 'asylum', 'rights', 'justice'],
+    'Emergency': ['emergency', 'urgent', 'crisis', 'disaster'],
+    'Food': ['food', 'nutrition', 'agriculture', 'hunger'],
+    'Social': ['social', 'community', 'integration', 'belonging'],
+}
+
+DEFAULT_CATEGORY = 'General'
+
+
+class CategoryClassifier:
+    """Keyword classifier compiled once from a category -> keywords table"""
+
+    STRATEGIES = ("first_match", "score")
+
+    def __init__(
+        self,
+        rules: Dict[str, List[str]] = None,
+        default: str = DEFAULT_CATEGORY,
+        strategy: str = "first_match",
+    ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown classifier strategy: {strategy}")
+
+        self.rules = rules or DEFAULT_CATEGORY_RULES
+        self.default = default
+        self.strategy = strategy
+        self._priority = {category: i for i, category in enumerate(self.rules)}
+        self._ordered = [
+            (category, tuple(k.lower() for k in keywords))
+            for category, keywords in self.rules.items()
+        ]
+
+        # Keyword -> category (first category listing a keyword owns it)
+        self._keyword_category: Dict[str, str] = {}
+        for category, keywords in self._ordered:
+            for keyword in keywords:
+                self._keyword_category.setdefault(keyword, category)
+
+        # Longest keywords first so e.g. "healthcare" wins over "health";
+        # an optional plural suffix keeps "jobs"/"schools" matching.
+        alternation = '|'.join(
+            re.escape(k) for k in sorted(self._keyword_category, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf'\b({alternation})(?:s|es)?\b')
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "CategoryClassifier":
+        """Load rules from a JSON object of {"Category": ["keyword", ...]}"""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f), **kwargs)
+
+    def scores(self, text: str) -> Counter:
+        """Number of whole-word keyword hits per category in lowercased text"""
+        hits = Counter()
+        for match in self._pattern.finditer(text):
+            hits[self._keyword_category[match.group(1)]] += 1
+        return hits
+
+    def classify(self, *parts: Optional[str]) -> str:
+        """Return the category for the given text fragments"""
+        text = ' '.join(p for p in parts if p).lower()
+
+        if self.strategy == "score":
+            hits = self.scores(text)
+            if not hits:
+                return self.default
+            return max(hits, key=lambda category: (hits[category], -self._priority[category]))
+
+        for category, keywords in self._ordered:
+            for keyword in keywords:
+                if keyword in text:
+                    return category
+        return self.default
+
+
+_default_classifier: Optional[CategoryClassifier] = None
+
+
+def get_default_classifier() -> CategoryClassifier:
+    """Process-wide classifier built from the GRANTS_CATEGORY_* settings"""
+    global _default_classifier
+    if _default_classifier is None:
+        strategy = settings.GRANTS_CATEGORY_STRATEGY
+        if settings.GRANTS_CATEGORY_RULES_FILE:
+            _default_classifier = CategoryClassifier.from_file(
+                settings.GRANTS_CATEGORY_RULES_FILE, strategy=strategy
+            )
+        else:
+            _default_classifier = CategoryClassifier(strategy=strategy)
+    return _default_classifier
@@ -0,0 +1,190 @@
+"""
+Outbound Email Dispatcher
+
+Delivers rendered emails through a pluggable transport. Handlers never
+call it directly: they write to the email outbox, whose drainer threads
+hand claimed rows to ``email_dispatcher.deliver`` (see email_outbox.py).
+
+- BrevoTransport keeps one keep-alive HTTP session per drainer thread;
+  EMAIL_API_URL can point it at a local fake server. LogTransport only
+  prints, for development.
+- A batch (up to EMAIL_BATCH_SIZE) becomes one Brevo request using
+  messageVersions, so bulk approvals cost a handful of API calls.
+- Each batch is sent once. Transport errors say whether they are worth
+  retrying (connection errors, 429, 5xx) and carry Retry-After; the outbox
+  schedules the retry, so a provider outage never blocks a drainer thread.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from itertools import groupby
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+
+
+@dataclass
+class EmailMessage:
+    """A single rendered email"""
+    to: str
+    subject: str
+    html_content: str
+    sender_email: str = None
+    sender_name: str = "Relivo App"
+
+    def __post_init__(self):
+        self.sender_email = self.sender_email or settings.MAIL_FROM or "no-reply@relivo.app"
+
+
+class EmailTransportError(Exception):
+    """Raised by a transport when a batch could not be delivered"""
+
+    def __init__(self, message: str, retryable: bool = False, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class LogTransport:
+    """Prints emails instead of sending them (development)"""
+
+    def send(self, messages: List[EmailMessage]):
+        for message in messages:
+            print(f"[EMAIL] (log transport) To: {message.to} | Subject: {message.subject}")
+
+
+class BrevoTransport:
+    """Brevo transactional email API over persistent keep-alive sessions"""
+
+    def __init__(self, api_key: str, url: str, pool_size: int = 4, timeout: float = 10):
+        self.api_key = api_key
+        self.url = url
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size))
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size))
+            session.headers.update({
+                "accept": "application/json",
+                "api-key": self.api_key or "",
+                "content-type": "application/json",
+            })
+            self._local.session = session
+        return session
+
+    @staticmethod
+    def build_payload(messages: List[EmailMessage]) -> dict:
+        """One request for all messages; each recipient gets its own message version"""
+        first = messages[0]
+        payload = {
+            "sender": {"name": first.sender_name, "email": first.sender_email},
+            "subject": first.subject,
+            "htmlContent": first.html_content,
+        }
+        if len(messages) == 1:
+            payload["to"] = [{"email": first.to}]
+        else:
+            payload["messageVersions"] = [
+                {"to": [{"email": m.to}], "subject": m.subject, "htmlContent": m.html_content}
+                for m in messages
+            ]
+        return payload
+
+    def send(self, messages: List[EmailMessage]):
+        if not self.api_key:
+            raise EmailTransportError("No API Key (MAIL_PASSWORD) found.")
+
+        # A request carries a single sender, so split mixed batches
+        key = lambda m: (m.sender_email, m.sender_name)
+        for _, group in groupby(sorted(messages, key=key), key=key):
+            self._post(self.build_payload(list(group)))
+
+    def _post(self, payload: dict):
+        try:
+            response = self._session().post(self.url, json=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise EmailTransportError(f"{type(e).__name__}: {e}", retryable=True)
+
+        if response.status_code in (200, 201, 202):
+            return
+        retryable = response.status_code == 429 or response.status_code >= 500
+        retry_after = None
+        if response.headers.get("Retry-After", "").isdigit():
+            retry_after = float(response.headers["Retry-After"])
+        raise EmailTransportError(
+            f"Status {response.status_code}: {response.text[:500]}",
+            retryable=retryable,
+            retry_after=retry_after,
+        )
+
+
+def get_default_transport():
+    """Transport selected by EMAIL_TRANSPORT"""
+    if settings.EMAIL_TRANSPORT == "log":
+        return LogTransport()
+    return BrevoTransport(
+        api_key=settings.MAIL_PASSWORD,
+        url=settings.EMAIL_API_URL,
+        pool_size=settings.EMAIL_OUTBOX_CONCURRENCY,
+    )
+
+
+class EmailDispatcher:
+    """Delivers EmailMessage batches through a transport"""
+
+    def __init__(self, transport=None, batch_size: int = 50):
+        self.transport = transport
+        self.batch_size = batch_size
+
+        self.sent = Counter()
+        self.failed = Counter()
+        self.batches = Counter()
+        self.send_latency_ms = Histogram()
+
+    def deliver(self, messages: List[EmailMessage]) -> Optional[EmailTransportError]:
+        """
+        Send a batch once; returns the transport error if it failed.
+
+        There is no retry here: the caller (the outbox drainer) decides from
+        ``error.retryable`` / ``error.retry_after`` when to try again.
+        """
+        if self.transport is None:
+            self.transport = get_default_transport()
+        self.batches.inc()
+        start = time.perf_counter()
+        try:
+            self.transport.send(messages)
+        except EmailTransportError as e:
+            self.failed.inc(len(messages))
+            print(f"[EMAIL] ✗ Failed to send {len(messages)} email(s): {e}")
+            return e
+        finally:
+            self.send_latency_ms.observe((time.perf_counter() - start) * 1000)
+
+        self.sent.inc(len(messages))
+        print(f"[EMAIL] ✓ Sent {len(messages)} email(s)")
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "transport": type(self.transport).__name__ if self.transport else None,
+            "sent": self.sent.value,
+            "failed": self.failed.value,
+            "batches": self.batches.value,
+            "send_latency_ms": self.send_latency_ms.snapshot(),
+        }
+
+
+email_dispatcher = EmailDispatcher(
+    batch_size=settings.EMAIL_BATCH_SIZE,
+)
@@ -0,0 +1,257 @@
+"""
+Email Outbox
+
+Durable delivery for notification emails. Handlers call ``enqueue_email``
+before committing, so the email row commits (or rolls back) together with
+the change that caused it. A drainer claims pending rows in batches and
+sends them through the email dispatcher's transport:
+
+- PostgreSQL: rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so
+  any number of drainers (one per app worker, or standalone processes)
+  never claim the same row.
+- SQLite: claims are a single UPDATE ... WHERE id IN (SELECT ...), which
+  SQLite serializes; drainers poll.
+
+Rows left in "sending" by a crashed drainer are reclaimed after
+EMAIL_OUTBOX_CLAIM_TIMEOUT. A batch the provider rejects outright (a 4xx
+other than 429) is resent message by message, so one bad recipient fails
+only its own row; transient errors leave the whole batch to the outbox's
+own retry. Failed sends back off exponentially (at least Retry-After) and
+are marked "failed" after EMAIL_OUTBOX_MAX_ATTEMPTS.
+
+Run standalone with:  python -m app.services.email_outbox
+"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from db import models
+from db.session import SessionLocal
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+from app.services.email_dispatcher import EmailMessage, EmailTransportError, email_dispatcher
+
+
+def enqueue_email(db: Session, message: EmailMessage) -> models.EmailOutbox:
+    """Add an email to the outbox; it is sent once the caller commits"""
+    row = models.EmailOutbox(
+        recipient=message.to,
+        subject=message.subject,
+        html_content=message.html_content,
+        sender_email=message.sender_email,
+        sender_name=message.sender_name,
+    )
+    db.add(row)
+    return row
+
+
+class EmailOutboxDrainer:
+    """Claims outbox rows in batches and sends them with bounded concurrency"""
+
+    def __init__(self, batch_size: int = 100, concurrency: int = 4, poll_interval: float = 1.0,
+                 max_attempts: int = 5, retry_backoff: float = 30, claim_timeout: float = 300,
+                 stats_ttl: float = 5):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.claim_timeout = claim_timeout
+        self.stats_ttl = stats_ttl
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="email-outbox")
+        self._thread = None
+        self._stop = threading.Event()
+
+        self.sent = Counter()
+        self.failed = Counter()
+        self.retried = Counter()
+        self.lag_ms = Histogram(buckets=(100, 500, 1000, 5000, 10000, 30000, 60000, 300000, 900000, 3600000))
+        self._recent_sends = deque()  # (monotonic time, count) within the last minute
+        self._recent_lock = threading.Lock()
+        self._backlog = None  # (monotonic time, status counts, oldest pending) for stats()
+
+    # ------------------------------------------------------------------
+    # Claiming
+    # ------------------------------------------------------------------
+
+    def claim_batch(self, db: Session) -> List[models.EmailOutbox]:
+        """Atomically mark up to batch_size due rows as ours and return them"""
+        Outbox = models.EmailOutbox
+        now = datetime.utcnow()
+        due = or_(
+            and_(Outbox.status == "pending", Outbox.available_at <= now),
+            and_(Outbox.status == "sending", Outbox.claimed_at < now - timedelta(seconds=self.claim_timeout)),
+        )
+        candidates = select(Outbox.id).where(due).order_by(Outbox.id).limit(self.batch_size)
+        if db.get_bind().dialect.name == "postgresql":
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        token = uuid.uuid4().hex
+        db.execute(
+            update(Outbox)
+            .where(Outbox.id.in_(candidates.scalar_subquery()), due)
+            .values(status="sending", claim_token=token, claimed_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return db.query(Outbox).filter(Outbox.claim_token == token).order_by(Outbox.id).all()
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    def run_once(self) -> int:
+        """Claim and send one batch; returns the number of rows processed"""
+        db = SessionLocal()
+        try:
+            rows = self.claim_batch(db)
+            if not rows:
+                return 0
+
+            chunk_size = max(email_dispatcher.batch_size, 1)
+            chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+            messages = [
+                [EmailMessage(
+                    to=row.recipient,
+                    subject=row.subject,
+                    html_content=row.html_content,
+                    sender_email=row.sender_email,
+                    sender_name=row.sender_name,
+                ) for row in chunk]
+                for chunk in chunks
+            ]
+            errors = list(self._executor.map(self._deliver_chunk, messages))
+
+            now = datetime.utcnow()
+            sent = 0
+            for chunk, chunk_errors in zip(chunks, errors):
+                for row, error in zip(chunk, chunk_errors):
+                    row.claim_token = None
+                    row.attempts += 1
+                    if error is None:
+                        row.status = "sent"
+                        row.sent_at = now
+                        row.last_error = None
+                        sent += 1
+                        self.lag_ms.observe((now - row.created_at).total_seconds() * 1000)
+                    elif row.attempts >= self.max_attempts:
+                        row.status = "failed"
+                        row.last_error = str(error)
+                        self.failed.inc()
+                    else:
+                        row.status = "pending"
+                        row.last_error = str(error)
+                        delay = max(self.retry_backoff * 2 ** (row.attempts - 1), error.retry_after or 0)
+                        row.available_at = now + timedelta(seconds=delay)
+                        self.retried.inc()
+            db.commit()
+
+            self.sent.inc(sent)
+            with self._recent_lock:
+                self._recent_sends.append((time.monotonic(), sent))
+            return len(rows)
+        except Exception as e:
+            db.rollback()
+            print(f"[EMAIL] ✗ Outbox drain failed: {str(e)}")
+            return 0
+        finally:
+            db.close()
+
+    def _deliver_chunk(self, messages: List[EmailMessage]) -> List[Optional[EmailTransportError]]:
+        """
+        Send a chunk as one batch; returns the error (or None) for each message.
+
+        A batch rejected outright is resent one message at a time, so a single
+        bad recipient fails only its own row instead of every row claimed with
+        it. Retryable errors (outages, throttling) are returned for the whole
+        chunk as they are, to be retried after the outbox backoff.
+        """
+        error = email_dispatcher.deliver(messages)
+        if error is None or error.retryable or len(messages) == 1:
+            return [error] * len(messages)
+        return [email_dispatcher.deliver([message]) for message in messages]
+
+    def run_forever(self):
+        """Drain until stopped; polls only when the outbox is empty"""
+        print("[EMAIL] Outbox drainer started")
+        while not self._stop.is_set():
+            if self.run_once() == 0:
+                self._stop.wait(self.poll_interval)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="email-outbox-drainer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self, db: Session) -> dict:
+        """Backlog figures come from the database at most once per stats_ttl seconds"""
+        Outbox = models.EmailOutbox
+        if self._backlog is None or time.monotonic() - self._backlog[0] >= self.stats_ttl:
+            counts = dict(db.query(Outbox.status, func.count(Outbox.id)).group_by(Outbox.status).all())
+            oldest_pending = db.query(func.min(Outbox.created_at)).filter(
+                Outbox.status.in_(["pending", "sending"])
+            ).scalar()
+            self._backlog = (time.monotonic(), counts, oldest_pending)
+        _, counts, oldest_pending = self._backlog
+
+        cutoff = time.monotonic() - 60
+        with self._recent_lock:
+            while self._recent_sends and self._recent_sends[0][0] < cutoff:
+                self._recent_sends.popleft()
+            sent_last_minute = sum(count for _, count in self._recent_sends)
+
+        return {
+            "drainer_running": bool(self._thread and self._thread.is_alive()),
+            "pending": counts.get("pending", 0),
+            "sending": counts.get("sending", 0),
+            "sent": counts.get("sent", 0),
+            "failed": counts.get("failed", 0),
+            "oldest_pending_age_seconds": (
+                round((datetime.utcnow() - oldest_pending).total_seconds(), 1) if oldest_pending else 0
+            ),
+            "sent_last_minute": sent_last_minute,
+            "drainer": {
+                "sent": self.sent.value,
+                "failed": self.failed.value,
+                "retried": self.retried.value,
+            },
+            "lag_ms": self.lag_ms.snapshot(),
+        }
+
+
+email_outbox_drainer = EmailOutboxDrainer(
+    batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+    concurrency=settings.EMAIL_OUTBOX_CONCURRENCY,
+    poll_interval=settings.EMAIL_OUTBOX_POLL_INTERVAL,
+    max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+    retry_backoff=settings.EMAIL_OUTBOX_RETRY_BACKOFF,
+    claim_timeout=settings.EMAIL_OUTBOX_CLAIM_TIMEOUT,
+)
+
+
+if __name__ == "__main__":
+    from db.session import engine, Base
+    Base.metadata.create_all(bind=engine, tables=[models.EmailOutbox.__table__])
+    try:
+        email_outbox_drainer.run_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,222 @@
+"""
+Moderation Event Bus
+
+In-process pub/sub for compact change events ("grant 42 verified",
+"organization 7 approved"), consumed by the Server-Sent Events stream so
+admin dashboards update without polling.
+
+- Write handlers call ``event_bus.publish`` after committing. Publishing
+  never blocks and never fails the request.
+- Subscribers are asyncio queues on the server's event loop. A subscriber
+  that falls EVENT_STREAM_QUEUE_MAX events behind has its backlog replaced
+  by a single "resync" event, telling the client to refetch.
+- EVENT_BUS_BACKEND=postgres fans events out across workers: publish runs
+  pg_notify() on the writer's own session (an extra pooled connection only
+  when none is passed) and a listener thread in every worker LISTENs on
+  EVENT_BUS_CHANNEL and delivers what it receives (including its own
+  events) to local subscribers. "local" delivers within this process only.
+"""
+
+import asyncio
+import json
+import re
+import select
+import threading
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import func
+from sqlalchemy import select as sql_select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import Counter
+
+# LISTEN takes an identifier, not a bind parameter, so the name is validated
+_CHANNEL_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class Subscription:
+    """One stream's queue of events, bound to the event loop that created it"""
+
+    def __init__(self, bus: "EventBus", topics: Optional[Set[str]], max_queue: int):
+        self.bus = bus
+        self.topics = topics  # None = every topic
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+
+    def wants(self, event: dict) -> bool:
+        return self.topics is None or event.get("topic") in self.topics
+
+    def offer(self, event: dict):
+        """Queue an event; runs on the subscriber's loop"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too far behind to catch up event by event
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"topic": "resync"})
+            self.bus.dropped.inc()
+
+
+class EventBus:
+    """Fans published events out to subscriptions, locally or via Postgres NOTIFY"""
+
+    def __init__(self, backend: str = "local", channel: str = "relivo_events", max_queue: int = 100):
+        if not _CHANNEL_NAME.match(channel):
+            raise ValueError(f"Invalid event bus channel name: {channel!r}")
+        self.backend = backend
+        self.channel = channel
+        self.max_queue = max_queue
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+        self.published = Counter()
+        self.delivered = Counter()
+        self.dropped = Counter()
+        self.notify_errors = Counter()
+
+    # ------------------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------------------
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None) -> Subscription:
+        """Register a subscription; call from the event loop that will consume it"""
+        subscription = Subscription(self, set(topics) if topics else None, self.max_queue)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish(self, topic: str, db: Optional[Session] = None, **details):
+        """
+        Publish an event after the change it describes has been committed.
+
+        Pass the request's session as ``db`` so NOTIFY is sent on its
+        connection instead of checking out another one from the pool.
+        """
+        event = {"topic": topic, **details}
+        self.published.inc()
+        if self.backend == "postgres":
+            try:
+                self._notify(event, db)
+                return
+            except Exception as e:
+                # Other workers miss this event; this worker's dashboards still get it
+                self.notify_errors.inc()
+                print(f"[EVENTS] ✗ NOTIFY failed, delivering locally: {str(e)}")
+        self._deliver(event)
+
+    def _notify(self, event: dict, db: Optional[Session] = None):
+        # Payloads are limited to 8000 bytes; events are a handful of fields
+        statement = sql_select(func.pg_notify(self.channel, json.dumps(event, default=str)))
+        if db is not None:
+            try:
+                db.execute(statement)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            return
+        from db.session import engine
+        with engine.connect() as conn:
+            conn.execute(statement)
+            conn.commit()
+
+    def _deliver(self, event: dict):
+        """Hand an event to every interested local subscription (thread-safe)"""
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.wants(event)]
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+                self.delivered.inc()
+            except RuntimeError:
+                # Loop already closed (server shutting down)
+                self.unsubscribe(subscription)
+
+    # ------------------------------------------------------------------
+    # Postgres listener
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the LISTEN thread when fanning out through Postgres"""
+        if self.backend != "postgres" or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen_forever, name="event-bus-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _listen_forever(self):
+        backoff = 1
+        while not self._stop.is_set():
+            try:
+                self._listen()
+                backoff = 1
+            except Exception as e:
+                print(f"[EVENTS] ✗ Listener error, reconnecting in {backoff}s: {str(e)}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def _listen(self):
+        from db.session import engine
+        # A dedicated connection, taken out of the pool for good
+        raw = engine.raw_connection()
+        raw.detach()
+        try:
+            conn = raw.driver_connection
+            conn.rollback()
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            print(f"[EVENTS] Listening on channel {self.channel}")
+            while not self._stop.is_set():
+                if select.select([conn], [], [], 1.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notification = conn.notifies.pop(0)
+                    try:
+                        self._deliver(json.loads(notification.payload))
+                    except ValueError:
+                        print(f"[EVENTS] ✗ Ignoring malformed payload on {self.channel}")
+        finally:
+            raw.close()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscribers = len(self._subscriptions)
+        return {
+            "backend": self.backend,
+            "listener_running": bool(self._thread and self._thread.is_alive()),
+            "subscribers": subscribers,
+            "published": self.published.value,
+            "delivered": self.delivered.value,
+            "dropped": self.dropped.value,
+            "notify_errors": self.notify_errors.value,
+        }
+
+
+event_bus = EventBus(
+    backend=settings.EVENT_BUS_BACKEND,
+    channel=settings.EVENT_BUS_CHANNEL,
+    max_queue=settings.EVENT_STREAM_QUEUE_MAX,
+)
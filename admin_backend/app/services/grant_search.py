@@ -0,0 +1,170 @@
+"""
+Grant Full-Text Search
+
+Ranked search over grant title, organizer, description and eligibility:
+
+- PostgreSQL: GIN index on a to_tsvector() expression, queried with
+  websearch_to_tsquery() and ranked with ts_rank().
+- SQLite: FTS5 external-content table kept in sync by triggers, ranked
+  with bm25(). Used for local development and tests.
+- Anything else (or SQLite without FTS5): case-insensitive LIKE fallback.
+
+The last search term is matched as a prefix, so results keep up while the
+user is still typing ("refu" finds "refugee").
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import column, false, func, literal_column, or_, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+
+from db import models
+
+PG_SEARCH_INDEX = "ix_grants_search_tsv"
+SQLITE_FTS_TABLE = "grants_fts"
+
+# Index expression and query expression must be identical for the planner to use the index
+_pg_config = literal_column("'english'::regconfig")
+_pg_document = func.to_tsvector(
+    _pg_config,
+    func.coalesce(models.Grant.title, '') + ' ' +
+    func.coalesce(models.Grant.organizer, '') + ' ' +
+    func.coalesce(models.Grant.description, '') + ' ' +
+    func.coalesce(models.Grant.eligibility, '')
+)
+
+_SQLITE_FTS_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        title, organizer, description, eligibility,
+        content='grants', content_rowid='id'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS grants_fts_ai AFTER INSERT ON grants BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, organizer, description, eligibility)
+        VALUES (new.id, new.title, new.organizer, new.description, new.eligibility);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS grants_fts_ad AFTER DELETE ON grants BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, organizer, description, eligibility)
+        VALUES ('delete', old.id, old.title, old.organizer, old.description, old.eligibility);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS grants_fts_au AFTER UPDATE ON grants BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, organizer, description, eligibility)
+        VALUES ('delete', old.id, old.title, old.organizer, old.description, old.eligibility);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, organizer, description, eligibility)
+        VALUES (new.id, new.title, new.organizer, new.description, new.eligibility);
+    END
+    """,
+]
+
+
+def ensure_search_index(engine: Engine):
+    """Create the dialect's full-text index if it does not exist yet"""
+    dialect = engine.dialect.name
+
+    if dialect == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {PG_SEARCH_INDEX} ON grants USING GIN "
+                f"({_pg_document.compile(dialect=engine.dialect, compile_kwargs={'literal_binds': True})})"
+            ))
+    elif dialect == "sqlite":
+        with engine.begin() as conn:
+            existed = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+            ), {"name": SQLITE_FTS_TABLE}).first()
+            for ddl in _SQLITE_FTS_DDL:
+                conn.execute(text(ddl))
+            if not existed:
+                # Index rows that existed before the FTS table
+                conn.execute(text(f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def _fts5_query(q: str) -> str:
+    """Quote each term so user input can't inject FTS5 operators; terms are ANDed, the last is a prefix"""
+    terms = ['"' + t.replace('"', '""') + '"' for t in q.split()]
+    if terms:
+        terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def _pg_tsquery(q: str):
+    """websearch_to_tsquery() for the input, with a plain-word last term ANDed in as a prefix (word:*)"""
+    *head, last = q.split()
+    if not re.fullmatch(r'\w+', last) or last.lower() == 'or':
+        # Quoted phrase, -negation or punctuation: keep websearch semantics
+        return func.websearch_to_tsquery(_pg_config, q)
+    prefix = func.to_tsquery(_pg_config, f"{last}:*")  # Only word characters, so no tsquery operators
+    if not head:
+        return prefix
+    head = ' '.join(head)
+    return func.websearch_to_tsquery(_pg_config, head).op('&&')(prefix)
+
+
+def _like_pattern(q: str) -> str:
+    """Substring pattern with LIKE wildcards in the input escaped (ESCAPE '\\')"""
+    escaped = q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+def _has_sqlite_fts(db: Session) -> bool:
+    return db.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+    ), {"name": SQLITE_FTS_TABLE}).first() is not None
+
+
+def search_grants_query(
+    db: Session,
+    q: str,
+    is_verified: Optional[bool] = None,
+    is_active: Optional[bool] = None,
+    country: Optional[str] = None,
+) -> Query:
+    """
+    Build a ranked grant search query (best match first).
+
+    The caller applies column projection and pagination.
+    """
+    query = db.query(models.Grant)
+    q = q.strip()
+    if not q:
+        return query.filter(false())
+    if is_verified is not None:
+        query = query.filter(models.Grant.is_verified == is_verified)
+    if is_active is not None:
+        query = query.filter(models.Grant.is_active == is_active)
+    if country:
+        query = query.filter(models.Grant.refugee_country == country)
+
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        ts_query = _pg_tsquery(q)
+        return query.filter(_pg_document.op('@@')(ts_query)).order_by(
+            func.ts_rank(_pg_document, ts_query).desc(), models.Grant.id.desc()
+        )
+
+    if dialect == "sqlite" and _has_sqlite_fts(db):
+        fts_table = table(SQLITE_FTS_TABLE, column('rowid'))
+        fts = literal_column(SQLITE_FTS_TABLE)  # The table name doubles as its hidden MATCH column
+        return query.join(
+            fts_table, fts_table.c.rowid == models.Grant.id
+        ).filter(
+            fts.op('MATCH')(_fts5_query(q))
+        ).order_by(func.bm25(fts), models.Grant.id.desc())
+
+    # Fallback: unindexed substring match
+    pattern = _like_pattern(q)
+    return query.filter(or_(
+        models.Grant.title.ilike(pattern, escape='\\'),
+        models.Grant.organizer.ilike(pattern, escape='\\'),
+        models.Grant.description.ilike(pattern, escape='\\'),
+        models.Grant.eligibility.ilike(pattern, escape='\\'),
+    )).order_by(models.Grant.created_at.desc(), models.Grant.id.desc())
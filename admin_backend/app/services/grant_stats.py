@@ -0,0 +1,133 @@
+"""
+Grant Statistics
+
+Aggregates every counter shown on the admin dashboard and insights screen
+with one conditional-aggregate query plus one UNION ALL query for the
+breakdowns, instead of a COUNT(*) per figure.
+
+With GRANT_STATS_SUMMARY enabled the result is also materialized into the
+grant_stats_summary table, refreshed by the grant write paths, so the
+dashboard is served from a single-row read.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict
+
+from sqlalchemy import case, func, literal, union_all
+from sqlalchemy.orm import Session
+
+from db import models
+from app.core.config import settings
+
+SUMMARY_ID = 1
+EXPIRING_SOON_DAYS = 7
+
+
+def _creator_type():
+    """Mirror of the admin app's Grant.creatorType, computed in SQL"""
+    return case(
+        (models.Grant.source == "grants.gov", "External"),
+        (models.Grant.organization_id.isnot(None), "Organization"),
+        (models.User.role == "admin", "Admin"),
+        else_="User",
+    )
+
+
+def compute_grant_stats(db: Session) -> Dict[str, any]:
+    """Compute all grant statistics from the grants table (two queries)"""
+    Grant = models.Grant
+    now = datetime.now()
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    expiring_before = now + timedelta(days=EXPIRING_SOON_DAYS)
+
+    counts = db.query(
+        func.count(Grant.id).label("total"),
+        func.count(Grant.id).filter(Grant.is_verified == True).label("verified"),
+        func.count(Grant.id).filter(Grant.is_active == True).label("active"),
+        func.count(Grant.id).filter(Grant.source == "grants.gov").label("from_grants_gov"),
+        func.count(Grant.id).filter(Grant.source == "manual").label("manual"),
+        func.count(Grant.id).filter(Grant.created_at >= month_start).label("created_this_month"),
+        func.count(Grant.id).filter(
+            Grant.deadline >= now, Grant.deadline <= expiring_before
+        ).label("expiring_soon"),
+    ).one()
+
+    creator_type = _creator_type()
+    breakdown_rows = db.execute(union_all(
+        db.query(literal("creator_type"), creator_type, func.count(Grant.id))
+        .outerjoin(models.User, Grant.creator_id == models.User.id)
+        .group_by(creator_type).statement,
+        db.query(literal("category"), Grant.category, func.count(Grant.id))
+        .group_by(Grant.category).statement,
+        db.query(literal("country"), Grant.refugee_country, func.count(Grant.id))
+        .group_by(Grant.refugee_country).statement,
+    )).all()
+
+    breakdowns = {"creator_type": {}, "category": {}, "country": {}}
+    for kind, key, count in breakdown_rows:
+        breakdowns[kind][key or "Unspecified"] = count
+
+    total = counts.total
+    return {
+        "total": total,
+        "verified": counts.verified,
+        "unverified": total - counts.verified,
+        "active": counts.active,
+        "inactive": total - counts.active,
+        "from_grants_gov": counts.from_grants_gov,
+        "manual": counts.manual,
+        "created_this_month": counts.created_this_month,
+        "expiring_soon": counts.expiring_soon,
+        "by_creator_type": breakdowns["creator_type"],
+        "by_category": breakdowns["category"],
+        "by_country": breakdowns["country"],
+        "generated_at": now.isoformat(),
+    }
+
+
+def refresh_summary(db: Session) -> Dict[str, any]:
+    """Recompute statistics and store them in the summary row"""
+    stats = compute_grant_stats(db)
+    summary = db.query(models.GrantStatsSummary).filter(
+        models.GrantStatsSummary.id == SUMMARY_ID
+    ).first()
+    if summary is None:
+        summary = models.GrantStatsSummary(id=SUMMARY_ID)
+        db.add(summary)
+    summary.data = stats
+    summary.refreshed_at = datetime.utcnow()
+    db.commit()
+    return stats
+
+
+def get_grant_stats(db: Session) -> Dict[str, any]:
+    """
+    Statistics for the dashboard.
+
+    Reads the materialized summary when enabled and fresh enough; date-relative
+    figures (this month, expiring soon) are bounded by GRANT_STATS_SUMMARY_MAX_AGE.
+    """
+    if not settings.GRANT_STATS_SUMMARY:
+        return compute_grant_stats(db)
+
+    summary = db.query(models.GrantStatsSummary).filter(
+        models.GrantStatsSummary.id == SUMMARY_ID
+    ).first()
+    max_age = timedelta(seconds=settings.GRANT_STATS_SUMMARY_MAX_AGE)
+    if summary and summary.data and summary.refreshed_at:
+        refreshed_at = summary.refreshed_at.replace(tzinfo=None)
+        if datetime.utcnow() - refreshed_at < max_age:
+            return summary.data
+    return refresh_summary(db)
+
+
+def on_grants_changed(db: Session):
+    """Keep the materialized summary current after a committed grant write"""
+    if not settings.GRANT_STATS_SUMMARY:
+        return
+    try:
+        refresh_summary(db)
+    except Exception as e:
+        # The summary is an optimisation; the next read recomputes if it is stale
+        db.rollback()
+        print(f"Failed to refresh grant stats summary: {str(e)}")
@@ -0,0 +1,87 @@
+"""
+Grants Table Version
+
+A single-row counter in the database, advanced inside every transaction
+that writes to the grants table:
+
+- ORM writes are stamped automatically by a before_flush hook: new and
+  modified grants get ``change_seq`` set to the new version, and deleted
+  grants leave a GrantTombstone carrying it.
+- Bulk UPDATE/DELETE statements and Core inserts (the importer) call
+  ``next_version`` themselves and stamp their rows the same way.
+
+Advancing the counter row-locks it until the transaction ends, so grant
+writers commit in version order: once version N is visible, every write
+stamped below N is too. That makes ``change_seq`` a safe sync position for
+the change feed, and lets list ETags revalidate with one primary-key read
+that every app worker agrees on.
+"""
+
+from sqlalchemy import event, insert, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from db import models
+
+VERSION_ID = 1
+
+_version_table = models.GrantTableVersion.__table__
+
+
+def ensure_version_row(engine: Engine):
+    """Create the counter row if it does not exist yet (call at startup)"""
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                _version_table.select().where(_version_table.c.id == VERSION_ID)
+            ).first()
+            if exists is None:
+                conn.execute(insert(_version_table).values(id=VERSION_ID, version=0))
+    except IntegrityError:
+        pass  # Another worker created it first
+
+
+def current_version(db: Session) -> int:
+    """The latest committed grants-table version (0 before the first write)"""
+    version = db.query(models.GrantTableVersion.version).filter(
+        models.GrantTableVersion.id == VERSION_ID
+    ).scalar()
+    return version or 0
+
+
+def next_version(db: Session) -> int:
+    """
+    Advance the version within the caller's transaction and return it.
+    Stamp the rows being written with the result before committing.
+    """
+    conn = db.connection()
+    version = conn.execute(
+        update(_version_table)
+        .where(_version_table.c.id == VERSION_ID)
+        .values(version=_version_table.c.version + 1)
+        .returning(_version_table.c.version)
+    ).scalar()
+    if version is None:
+        conn.execute(insert(_version_table).values(id=VERSION_ID, version=1))
+        version = 1
+    return version
+
+
+@event.listens_for(Session, "before_flush")
+def _stamp_grant_changes(session: Session, flush_context, instances):
+    """Stamp ORM grant writes with a new version and record tombstones for deletes"""
+    changed = [obj for obj in session.new if isinstance(obj, models.Grant)]
+    changed += [
+        obj for obj in session.dirty
+        if isinstance(obj, models.Grant) and session.is_modified(obj, include_collections=False)
+    ]
+    deleted = [obj for obj in session.deleted if isinstance(obj, models.Grant)]
+    if not changed and not deleted:
+        return
+
+    version = next_version(session)
+    for grant in changed:
+        grant.change_seq = version
+    for grant in deleted:
+        session.add(models.GrantTombstone(grant_id=grant.id, change_seq=version))
@@ -0,0 +1,140 @@
+"""
+Grants.gov Import Jobs
+
+Runs Grants.gov imports in the background so the HTTP request returns
+immediately with a job id that admins can poll for progress.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from db.session import SessionLocal
+from app.services.grants_gov_importer import GrantsGovImporter
+from app.services import grant_stats
+from app.core.cache import invalidate_grant_caches
+from app.services.event_bus import event_bus
+
+
+class ImportJob:
+    """State of a single background import"""
+
+    def __init__(self, xml_url: Optional[str], incremental: bool):
+        self.id = uuid.uuid4().hex
+        self.xml_url = xml_url
+        self.incremental = incremental
+        self.status = "queued"  # queued, running, succeeded, failed
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.importer: Optional[GrantsGovImporter] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> Dict[str, any]:
+        """Snapshot of the job, read live from the running importer"""
+        importer = self.importer
+        end = self.finished_at or datetime.utcnow()
+        elapsed = (end - self.started_at).total_seconds() if self.started_at else 0.0
+        rows = importer.rows_processed if importer else 0
+
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "phase": importer.phase if importer else "pending",
+            "xml_url": self.xml_url,
+            "incremental": self.incremental,
+            "rows_processed": rows,
+            "imported": importer.imported_count if importer else 0,
+            "skipped": importer.skipped_count if importer else 0,
+            "unchanged": importer.unchanged_count if importer else 0,
+            "not_modified": importer.not_modified if importer else False,
+            "errors": list(importer.errors) if importer else [],
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round(elapsed, 2),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+            "stage_seconds": importer.stage_timings() if importer else {},
+        }
+
+
+class ImportJobManager:
+    """
+    Runs imports one at a time on a dedicated executor.
+
+    Each job opens its own database session, so an import never holds a
+    connection belonging to a request. Submitting while a job is queued
+    or running returns the existing job instead of starting another one.
+    """
+
+    MAX_HISTORY = 20  # Finished jobs kept for polling
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grants-import")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+        self._active: Optional[ImportJob] = None
+
+    def submit(self, xml_url: Optional[str] = None, incremental: bool = True) -> Tuple[ImportJob, bool]:
+        """
+        Queue an import.
+
+        Returns:
+            Tuple of (job, created) - created is False when an import was
+            already in progress and that job is returned instead
+        """
+        with self._lock:
+            if self._active is not None and not self._active.is_finished:
+                return self._active, False
+
+            job = ImportJob(xml_url, incremental)
+            self._jobs[job.id] = job
+            self._active = job
+            self._trim_history()
+
+        self._executor.submit(self._run, job)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[ImportJob]:
+        """Jobs, newest first"""
+        return list(reversed(self._jobs.values()))
+
+    def _run(self, job: ImportJob):
+        db = SessionLocal()
+        try:
+            job.importer = GrantsGovImporter(db)
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            job.importer.import_grants(xml_url=job.xml_url, incremental=job.incremental)
+            job.status = "failed" if job.importer.phase == "failed" else "succeeded"
+        except Exception as e:
+            print(f"Import job {job.id} crashed: {str(e)}")
+            if job.importer:
+                job.importer.errors.append(f"Import failed: {str(e)}")
+            job.status = "failed"
+        finally:
+            if job.importer and job.importer.imported_count:
+                invalidate_grant_caches()
+                grant_stats.on_grants_changed(db)
+                event_bus.publish("grant", db=db, action="imported", affected=job.importer.imported_count)
+            job.finished_at = datetime.utcnow()
+            db.close()
+
+    def _trim_history(self):
+        while len(self._jobs) > self.MAX_HISTORY:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if not oldest.is_finished:
+                break
+            del self._jobs[oldest_id]
+
+
+import_jobs = ImportJobManager()
@@ -0,0 +1,451 @@
+"""
+Offline load benchmark for the admin backend
+
+Usage:
+    python benchmark_api.py [--grants 10000] [--orgs 1000] [--concurrency 8]
+                            [--requests 200] [--extract path/to/GrantsDBExtractv2.zip]
+                            [--baseline benchmark_baseline.json] [--save-baseline FILE]
+
+Seeds a fresh database (SQLite by default, or --database-url for Postgres)
+with a synthetic catalogue of grants, organizations and creators, then drives
+the FastAPI app in-process (httpx over ASGI, no network) with concurrent
+clients and reports p50/p95/p99 latency and throughput per scenario:
+
+    verified_list  verified grants, as served to the public app
+    admin_list     the admin "all grants" page
+    search         full-text search with random terms
+    stats          dashboard statistics
+    login          password login (dominated by password hashing)
+    import         a full Grants.gov import job (only with --extract, e.g. one
+                   from generate_grants_extract.py; served from a local
+                   HTTP server so the download stage is exercised too)
+
+With --baseline, results are compared against a stored run and the script
+exits with status 1 if any scenario's p95 or throughput regressed by more
+than --tolerance. Runs are reproducible for a given --seed.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import partial
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+ADMIN_EMAIL = "bench-admin@example.org"
+ADMIN_PASSWORD = "bench-password"
+SEED_CHUNK = 5000
+
+WORDS = (
+    "refugee housing shelter education training school university health medical "
+    "clinic employment job business entrepreneur legal asylum rights justice "
+    "emergency crisis disaster food nutrition agriculture community integration "
+    "language youth women children family resettlement support program fund "
+    "research development capacity services outreach mental counseling digital"
+).split()
+CATEGORIES = ("Housing", "Education", "Healthcare", "Employment", "Legal", "Emergency", "Food", "Social", "General")
+COUNTRIES = ("Syria", "Afghanistan", "Ukraine", "Sudan", "Venezuela", "Myanmar", "Somalia", "Eritrea", None)
+ORG_TYPES = ("Government", "NGO", "Private")
+
+
+def percentile(sorted_values, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+# ============================================================================
+# SEEDING
+# ============================================================================
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed_database(args):
+    """Create the schema and bulk-insert the synthetic catalogue"""
+    from sqlalchemy import insert, text
+    from app.core import security
+    from app.services import grant_version
+    from app.services.grant_search import SQLITE_FTS_TABLE, ensure_search_index
+    from db import models
+    from db.session import Base, SessionLocal, engine
+
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+
+    Base.metadata.drop_all(bind=engine)
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}"))
+    Base.metadata.create_all(bind=engine)
+
+    with SessionLocal() as db:
+        conn = db.connection()
+        conn.execute(insert(models.User.__table__), [{
+            "email": ADMIN_EMAIL,
+            "hashed_password": security.get_password_hash(ADMIN_PASSWORD),
+            "full_name": "Benchmark Admin",
+            "role": "admin",
+            "is_active": True,
+            "is_verified": True,
+        }])
+        # Creators share one hash; nobody logs in as them
+        creator_hash = security.get_password_hash(ADMIN_PASSWORD)
+        conn.execute(insert(models.User.__table__), [{
+            "email": f"creator{i}@example.org",
+            "hashed_password": creator_hash,
+            "role": rng.choice(("user", "organization")),
+            "is_active": True,
+            "is_verified": True,
+        } for i in range(args.creators)])
+        creator_ids = [row.id for row in db.query(models.User.id).filter(models.User.role != "admin")]
+
+        organizations = [{
+            "user_id": rng.choice(creator_ids),
+            "name": f"{_sentence(rng, 2).title()} Foundation {i}",
+            "description": _sentence(rng, 30),
+            "status": rng.choice(("pending", "approved", "approved", "approved", "suspended", "rejected")),
+            "contact_email": f"org{i}@example.org",
+            "country": rng.choice(COUNTRIES),
+            "type": rng.choice(ORG_TYPES),
+        } for i in range(args.orgs)]
+        for start in range(0, len(organizations), SEED_CHUNK):
+            conn.execute(insert(models.Organization.__table__), organizations[start:start + SEED_CHUNK])
+        org_rows = db.query(models.Organization.id, models.Organization.name).all()
+
+        version = grant_version.next_version(db)
+        for start in range(0, args.grants, SEED_CHUNK):
+            chunk = []
+            for _ in range(start, min(start + SEED_CHUNK, args.grants)):
+                org_id, org_name = rng.choice(org_rows)
+                chunk.append({
+                    "title": _sentence(rng, rng.randint(4, 10)).title(),
+                    "organizer": org_name,
+                    "deadline": now + timedelta(days=rng.randint(-90, 365)) if rng.random() < 0.9 else None,
+                    "description": _sentence(rng, rng.randint(40, 120)),
+                    "eligibility": _sentence(rng, rng.randint(10, 40)),
+                    "apply_url": f"https://example.org/apply/{start}-{len(chunk)}",
+                    "category": rng.choice(CATEGORIES),
+                    "source": "manual",
+                    "refugee_country": rng.choice(COUNTRIES),
+                    "is_verified": rng.random() < 0.6,
+                    "is_active": rng.random() < 0.9,
+                    "creator_id": rng.choice(creator_ids) if rng.random() < 0.8 else None,
+                    "organization_id": org_id if rng.random() < 0.5 else None,
+                    "amount": f"${rng.randint(1, 500) * 1000:,}",
+                    "location": rng.choice(COUNTRIES),
+                    "eligibility_criteria": [_sentence(rng, 4) for _ in range(rng.randint(0, 4))],
+                    "required_documents": [_sentence(rng, 2) for _ in range(rng.randint(0, 3))],
+                    "created_at": now - timedelta(seconds=rng.randint(0, 2 * 365 * 86400)),
+                    "change_seq": version,
+                })
+            conn.execute(insert(models.Grant.__table__), chunk)
+        db.commit()
+
+    # After the bulk insert, so SQLite builds the FTS index once instead of per row
+    ensure_search_index(engine)
+
+
+def database_counts():
+    """(grants, organizations) currently in the database"""
+    from db import models
+    from db.session import SessionLocal
+
+    with SessionLocal() as db:
+        return db.query(models.Grant).count(), db.query(models.Organization).count()
+
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+
+def make_scenarios(args, headers):
+    max_skip = max(0, min(args.grants, 5000) - 100)
+
+    async def verified_list(client, rng):
+        return await client.get(
+            "/grants/admin/verified",
+            params={"skip": rng.randrange(0, max_skip + 1, 100), "limit": 100},
+            headers=headers,
+        )
+
+    async def admin_list(client, rng):
+        return await client.get(
+            "/grants/admin/all",
+            params={"skip": rng.randrange(0, max_skip + 1, 100), "limit": 100, "view": rng.choice(("full", "summary"))},
+            headers=headers,
+        )
+
+    async def search(client, rng):
+        return await client.get(
+            "/grants/search",
+            params={"q": " ".join(rng.sample(WORDS, rng.randint(1, 2))), "limit": 50},
+            headers=headers,
+        )
+
+    async def stats(client, rng):
+        return await client.get("/grants/admin/stats", headers=headers)
+
+    async def login(client, rng):
+        return await client.post("/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+
+    return {
+        "verified_list": verified_list,
+        "admin_list": admin_list,
+        "search": search,
+        "stats": stats,
+        "login": login,
+    }
+
+
+async def run_scenario(client, request, total: int, concurrency: int, seed: int) -> dict:
+    """Send ``total`` requests from ``concurrency`` clients; latencies in ms"""
+    latencies = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker(worker_id: int):
+        nonlocal errors
+        rng = random.Random(seed * 1000 + worker_id)
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                ok = (await request(client, rng)).status_code < 400
+            except Exception:
+                ok = False
+            latencies.append((time.perf_counter() - start) * 1000)
+            if not ok:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return summarize(latencies, errors, elapsed)
+
+
+def summarize(latencies, errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+# ============================================================================
+# IMPORT
+# ============================================================================
+
+def serve_directory(directory: str):
+    """Serve ``directory`` over HTTP on a free localhost port; returns the server"""
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def reset_imported_grants():
+    """Remove what the previous import run wrote, so every run does the same work"""
+    from db import models
+    from db.session import SessionLocal
+
+    with SessionLocal() as db:
+        db.query(models.Grant).filter(models.Grant.source == "grants.gov").delete(synchronize_session=False)
+        db.query(models.GrantImportFingerprint).delete(synchronize_session=False)
+        db.commit()
+
+
+async def run_imports(client, headers, xml_url: str, runs: int) -> dict:
+    """Time full import jobs end to end (submit until the job finishes), one at a time"""
+    latencies = []
+    errors = 0
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(runs):
+        await asyncio.to_thread(reset_imported_grants)
+        run_start = time.perf_counter()
+        response = await client.post("/grants/admin/import", params={"xml_url": xml_url, "full": True}, headers=headers)
+        job = response.json()
+        while job.get("status") not in ("succeeded", "failed"):
+            await asyncio.sleep(0.05)
+            job = (await client.get(f"/grants/admin/import/jobs/{job['job_id']}", headers=headers)).json()
+        latencies.append((time.perf_counter() - run_start) * 1000)
+        rows = job["rows_processed"]
+        if job["status"] == "failed":
+            errors += 1
+            print(f"  import failed: {job['errors'][:3]}")
+    result = summarize(latencies, errors, time.perf_counter() - start)
+    result["rows_per_run"] = rows
+    return result
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def compare(results: dict, baseline: dict, tolerance: float):
+    """Lines describing the change against the baseline, and whether anything regressed"""
+    regressed = False
+    lines = []
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            lines.append(f"{name:<14} (not in baseline)")
+            continue
+        p95_change = current["p95_ms"] / previous["p95_ms"] - 1 if previous["p95_ms"] else 0.0
+        rps_change = current["throughput_rps"] / previous["throughput_rps"] - 1 if previous["throughput_rps"] else 0.0
+        bad = p95_change > tolerance or rps_change < -tolerance or current["errors"] > previous["errors"]
+        regressed = regressed or bad
+        lines.append(
+            f"{name:<14} p95 {p95_change:+7.1%}  throughput {rps_change:+7.1%}"
+            f"{'  <-- REGRESSION' if bad else ''}"
+        )
+    return lines, regressed
+
+
+def print_results(results: dict):
+    print("=" * 78)
+    print(f"{'scenario':<14}{'requests':>9}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}")
+    print("-" * 78)
+    for name, r in results.items():
+        print(
+            f"{name:<14}{r['requests']:>9}{r['errors']:>8}"
+            f"{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['throughput_rps']:>10.2f}"
+        )
+    print("=" * 78)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+async def run_benchmarks(args) -> dict:
+    import httpx
+    from app.main import app
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            login = await client.post("/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+            login.raise_for_status()
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            scenarios = make_scenarios(args, headers)
+            selected = args.scenarios.split(",") if args.scenarios else list(scenarios) + ["import"]
+            for name in selected:
+                if name == "import":
+                    continue
+                request = scenarios[name]
+                await run_scenario(client, request, args.warmup, args.concurrency, args.seed)
+                print(f"Running {name}...")
+                results[name] = await run_scenario(client, request, args.requests, args.concurrency, args.seed)
+
+            if "import" in selected and args.extract:
+                server = serve_directory(os.path.dirname(os.path.abspath(args.extract)))
+                try:
+                    xml_url = f"http://127.0.0.1:{server.server_port}/{os.path.basename(args.extract)}"
+                    print(f"Running import ({args.import_runs} run(s) of {args.extract})...")
+                    results["import"] = await run_imports(client, headers, xml_url, args.import_runs)
+                finally:
+                    server.shutdown()
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--database-url", help="Defaults to a SQLite file in the temp directory")
+    parser.add_argument("--grants", type=int, default=10000)
+    parser.add_argument("--orgs", type=int, default=1000)
+    parser.add_argument("--creators", type=int, default=200)
+    parser.add_argument("--reuse", action="store_true", help="Skip seeding; benchmark the database as it is")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per scenario")
+    parser.add_argument("--scenarios", help="Comma-separated subset, e.g. admin_list,search")
+    parser.add_argument("--extract", help="Grants.gov extract (ZIP) for the import scenario")
+    parser.add_argument("--import-runs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", help="Compare against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95/throughput change (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", help="Write results to this file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Configure the app before anything imports it
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'relivo_benchmark.db')}"
+    os.environ.setdefault("SLOW_REQUEST_MS", "0")
+    os.environ.setdefault("EMAIL_OUTBOX_DRAINER", "false")
+    import logging
+    logging.disable(logging.WARNING)  # Request and SQL logs would dominate the output
+
+    if not args.reuse:
+        print(f"Seeding {args.grants} grants, {args.orgs} organizations, {args.creators} creators...")
+        start = time.perf_counter()
+        seed_database(args)
+        print(f"Seeded in {time.perf_counter() - start:.1f}s")
+    else:
+        # Describe the database actually benchmarked, not the seeding defaults
+        args.grants, args.orgs = database_counts()
+        print(f"Reusing database with {args.grants} grants, {args.orgs} organizations")
+
+    results = asyncio.run(run_benchmarks(args))
+    print_results(results)
+
+    report = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "grants": args.grants,
+            "orgs": args.orgs,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "database": os.environ["DATABASE_URL"].split(":", 1)[0],
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        workload = ("grants", "orgs", "concurrency", "database")
+        if any(baseline["meta"].get(key) != report["meta"][key] for key in workload):
+            print(f"Warning: baseline workload differs: {[(k, baseline['meta'].get(k)) for k in workload]}")
+        lines, regressed = compare(results, baseline, args.tolerance)
+        print(f"Compared with {args.baseline} (tolerance {args.tolerance:.0%}):")
+        print("\n".join(lines))
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Micro-benchmark: compiled category classifier vs the legacy if/elif chain
+
+Usage:
+    python benchmark_category_classifier.py path/to/GrantsDBExtractv2.zip [repeat]
+
+Reads every opportunity from a Grants.gov extract (ZIP or XML), then times
+per-grant classification with the legacy chain and each classifier strategy,
+and reports how often each strategy agrees with the legacy result.
+"""
+
+import sys
+import os
+import time
+import zipfile
+from lxml import etree
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.category_classifier import CategoryClassifier
+
+OPPORTUNITY_TAGS = {
+    'OpportunityForecastDetail',
+    'OpportunityForecastDetail_1_0',
+    'OpportunitySynopsisDetail_1_0',
+    'Opportunity',
+}
+
+
+def legacy_detect_category(title, description, organizer, eligibility) -> str:
+    """The pre-classifier implementation, kept here as the baseline"""
+    text = f"{title or ''} {description or ''} {organizer or ''} {eligibility or ''}".lower()
+
+    if any(w in text for w in ['housing', 'shelter', 'accommodation']):
+        return 'Housing'
+    elif any(w in text for w in ['education', 'training', 'school', 'university', 'curriculum']):
+        return 'Education'
+    elif any(w in text for w in ['health', 'medical', 'healthcare', 'disease', 'vaccine']):
+        return 'Healthcare'
+    elif any(w in text for w in ['employment', 'job', 'business', 'entrepreneur', 'work']):
+        return 'Employment'
+    elif any(w in text for w in ['legal', 'reunification', 'asylum', 'rights', 'justice']):
+        return 'Legal'
+    elif any(w in text for w in ['emergency', 'urgent', 'crisis', 'disaster']):
+        return 'Emergency'
+    elif any(w in text for w in ['food', 'nutrition', 'agriculture', 'hunger']):
+        return 'Food'
+    elif any(w in text for w in ['social', 'community', 'integration', 'belonging']):
+        return 'Social'
+
+    return 'General'
+
+
+def load_texts(path: str):
+    """Collect (title, description, organizer, eligibility) for every opportunity"""
+    def first(element, *tags):
+        for tag in tags:
+            value = element.findtext(f'{{*}}{tag}')
+            if value and value.strip():
+                return value.strip()
+        return ''
+
+    def read(stream):
+        texts = []
+        for _, element in etree.iterparse(stream, events=('end',)):
+            if etree.QName(element).localname not in OPPORTUNITY_TAGS:
+                continue
+            texts.append((
+                first(element, 'OpportunityTitle'),
+                first(element, 'Description', 'OpportunityDescription', 'AdditionalInformation')[:2000],
+                first(element, 'AgencyName', 'AgencyCode'),
+                first(element, 'EligibilityCategory', 'ApplicantEligibility', 'Eligibility')[:1000],
+            ))
+            element.clear()
+        return texts
+
+    if path.endswith('.zip'):
+        with zipfile.ZipFile(path) as zip_file:
+            xml_name = next(f for f in zip_file.namelist() if f.endswith('.xml'))
+            with zip_file.open(xml_name) as stream:
+                return read(stream)
+    with open(path, 'rb') as stream:
+        return read(stream)
+
+
+def time_per_grant(func, texts, repeat: int) -> float:
+    """Best-of-N microseconds per grant"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for parts in texts:
+            func(*parts)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1_000_000
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    path = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"Loading opportunities from {path}...")
+    texts = load_texts(path)
+    if not texts:
+        print("No opportunities found")
+        sys.exit(1)
+    print(f"Loaded {len(texts)} opportunities")
+
+    legacy_us = time_per_grant(legacy_detect_category, texts, repeat)
+    legacy = [legacy_detect_category(*parts) for parts in texts]
+
+    print("=" * 60)
+    print(f"{'legacy if/elif chain':<22}: {legacy_us:8.2f} us/grant")
+    for strategy in CategoryClassifier.STRATEGIES:
+        classifier = CategoryClassifier(strategy=strategy)
+        us = time_per_grant(classifier.classify, texts, repeat)
+        agree = sum(
+            1 for parts, expected in zip(texts, legacy)
+            if classifier.classify(*parts) == expected
+        )
+        print(
+            f"{strategy:<22}: {us:8.2f} us/grant  "
+            f"({legacy_us / us:.2f}x legacy, {agree / len(texts) * 100:.1f}% agreement)"
+        )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
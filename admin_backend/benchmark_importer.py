@@ -0,0 +1,103 @@
+"""
+Grants.gov importer benchmark
+
+Usage:
+    python benchmark_importer.py [extract.zip | file:// URL | http(s) URL]
+                                 [--count 50000] [--workers 1] [--database-url URL]
+
+Runs one full (non-incremental) import into a fresh database and reports
+the time spent in each stage (download, unzip, parse, extract, classify,
+db_write), overall throughput and peak RSS. Without an extract, one with
+--count opportunities is generated first (see generate_grants_extract.py),
+so no network access is needed.
+"""
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = ("download", "unzip", "parse", "extract", "classify", "db_write")
+
+
+def peak_rss_mb(who=resource.RUSAGE_SELF) -> float:
+    """High-water resident set size (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("extract", nargs="?", help="Extract path or URL; generated when omitted")
+    parser.add_argument("--count", type=int, default=50000, help="Opportunities in the generated extract")
+    parser.add_argument("--workers", type=int, default=1, help="Extraction processes (GRANTS_IMPORT_WORKERS)")
+    parser.add_argument("--database-url", help="Defaults to a fresh SQLite file in the temp directory")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="relivo_import_bench_")
+    extract = args.extract
+    if not extract:
+        from generate_grants_extract import generate_extract
+        extract = os.path.join(workdir, "GrantsDBExtractv2.zip")
+        print(f"Generating {args.count} opportunities...")
+        generate_extract(extract, args.count, seed=args.seed)
+
+    # Configure the app before anything imports it
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(workdir, 'import.db')}"
+
+    from app.services.grant_search import ensure_search_index
+    from app.services.grants_gov_importer import GrantsGovImporter
+    from db.session import Base, SessionLocal, engine
+    import db.models  # Register models with Base
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
+
+    rss_before = peak_rss_mb()
+    db = SessionLocal()
+    try:
+        importer = GrantsGovImporter(db, workers=args.workers)
+        # The importer reports progress with print(); keep the benchmark output readable
+        stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+        start = time.perf_counter()
+        try:
+            result = importer.import_grants(xml_url=extract, incremental=False)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    stages = result["stage_seconds"]
+    rows = importer.rows_processed
+    print("=" * 60)
+    print(f"Extract:    {extract}")
+    print(f"Workers:    {args.workers}")
+    print(f"Imported:   {result['imported']}  skipped: {result['skipped']}  errors: {len(result['errors'])}")
+    print(f"Total:      {elapsed:8.2f} s  ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
+    print("-" * 60)
+    for stage in STAGES:
+        seconds = stages.get(stage, 0.0)
+        print(f"{stage:<12}{seconds:8.2f} s  {seconds / elapsed * 100 if elapsed else 0:5.1f}%")
+    print("-" * 60)
+    print(f"Peak RSS:   {peak_rss_mb():8.1f} MB (before import {rss_before:.1f} MB)")
+    if args.workers > 1:
+        print(f"Workers:    {peak_rss_mb(resource.RUSAGE_CHILDREN):8.1f} MB peak per process")
+        print("Extract and classify are summed across worker processes.")
+    print("=" * 60)
+    if result["errors"]:
+        print("First errors:")
+        for error in result["errors"][:5]:
+            print(f"  {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import logging
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from db.pool import (
+    InstrumentedAsyncAdaptedQueuePool, InstrumentedNullPool, attach_pool_metrics, set_sqlite_pragmas
+)
+from app.core.config import settings
+from app.core.instrumentation import attach_query_metrics
+
+logger = logging.getLogger(__name__)
+
+# Async counterpart of db/session.py, only imported when DB_ASYNC is enabled.
+# Requires asyncpg (PostgreSQL) or aiosqlite (SQLite).
+
+if not settings.DATABASE_URL:
+    raise ValueError("DATABASE_URL is not set in .env")
+
+
+def _async_url(database_url: str):
+    """Map the configured sync URL onto its async driver; returns (url, connect_args)"""
+    url = make_url(database_url)
+    connect_args = {}
+
+    if url.drivername.startswith("sqlite"):
+        return url.set(drivername="sqlite+aiosqlite"), connect_args
+
+    # postgres:// and postgresql[+driver]:// -> asyncpg
+    # asyncpg doesn't understand libpq's sslmode/channel_binding query options
+    query = dict(url.query)
+    sslmode = query.pop("sslmode", None)
+    query.pop("channel_binding", None)
+    if sslmode and sslmode != "disable":
+        connect_args["ssl"] = "require" if sslmode in ("allow", "prefer") else sslmode
+    return url.set(drivername="postgresql+asyncpg", query=query), connect_args
+
+
+ASYNC_DATABASE_URL, _connect_args = _async_url(settings.DATABASE_URL)
+
+if ASYNC_DATABASE_URL.drivername.startswith("sqlite"):
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=InstrumentedNullPool)
+    if settings.SQLITE_WAL:
+        event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+else:
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        connect_args=_connect_args,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+attach_pool_metrics(async_engine.sync_engine, "async")
+attach_query_metrics(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False)
+
+
+async def get_async_db():
+    """Async database session dependency"""
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            await db.rollback()
+            raise
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, Text, Index, ForeignKey
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, Text, Index, ForeignKey, select
+from sqlalchemy.orm import column_property, relationship
 from sqlalchemy.sql import func
 from .session import Base
 
@@ -67,21 +68,102 @@ class Grant(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Grants-table version of the last write to this row (see app/services/grant_version.py)
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Relationships
     creator = relationship("User", foreign_keys=[creator_id])
     organization = relationship("Organization", foreign_keys=[organization_id])
     
-    @property
-    def creator_role(self) -> str:
-        if self.creator:
-            return self.creator.role
-        return "user"
+    # Loaded in the same SELECT as the grant (no per-row lazy load of creator);
+    # "user" when the grant has no creator
+    creator_role = column_property(
+        func.coalesce(
+            select(User.role).where(User.id == creator_id).correlate_except(User).scalar_subquery(),
+            "user",
+        )
+    )
 
     # Composite indexes for common queries
     __table_args__ = (
         Index('ix_grants_verified_active', 'is_verified', 'is_active'),
         Index('ix_grants_country_verified', 'refugee_country', 'is_verified'),
         Index('ix_grants_deadline_verified', 'deadline', 'is_verified'),
+        # Keyset pagination on (created_at, id), optionally within a verification state
+        Index('ix_grants_created_id', 'created_at', 'id'),
+        Index('ix_grants_verified_created_id', 'is_verified', 'created_at', 'id'),
+        # Change feed: rows written after a (change_seq, id) position
+        Index('ix_grants_change_seq_id', 'change_seq', 'id'),
+    )
+
+class GrantImportFingerprint(Base):
+    """Content hash of each Grants.gov opportunity seen by the importer (for delta imports)"""
+    __tablename__ = "grant_import_fingerprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    external_id = Column(String(100), unique=True, nullable=False, index=True)
+    content_hash = Column(String(64), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class GrantImportState(Base):
+    """HTTP validators of the last successfully imported extract, per source URL"""
+    __tablename__ = "grant_import_state"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source_url = Column(String(500), unique=True, nullable=False)
+    etag = Column(String(200), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+    last_imported_at = Column(DateTime(timezone=True), nullable=True)
+
+class GrantStatsSummary(Base):
+    """Materialized dashboard statistics (single row), refreshed on grant writes"""
+    __tablename__ = "grant_stats_summary"
+
+    id = Column(Integer, primary_key=True)
+    data = Column(JSON, nullable=False)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+
+class GrantTableVersion(Base):
+    """Counter advanced inside every grant write transaction (single row); list ETags and change_seq"""
+    __tablename__ = "grant_table_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class GrantTombstone(Base):
+    """A deleted grant, kept so change-feed clients can drop their copy"""
+    __tablename__ = "grant_tombstones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    grant_id = Column(Integer, nullable=False, index=True)
+    change_seq = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Naive UTC
+
+    __table_args__ = (
+        Index('ix_grant_tombstones_seq_id', 'change_seq', 'id'),
+    )
+
+class EmailOutbox(Base):
+    """Rendered emails awaiting delivery, written in the same transaction as their cause"""
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(500), nullable=False)
+    html_content = Column(Text, nullable=False)
+    sender_email = Column(String(255), nullable=True)
+    sender_name = Column(String(255), nullable=True)
+    status = Column(String(20), default="pending", nullable=False)  # pending, sending, sent, failed
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    claim_token = Column(String(32), nullable=True, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Naive UTC throughout
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    claimed_at = Column(DateTime, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_email_outbox_status_available', 'status', 'available_at'),
     )
 
 class Organization(Base):
@@ -0,0 +1,147 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, StaticPool
+
+from app.core.metrics import Counter, Histogram
+
+# Connection pool instrumentation, exported by GET /metrics/pool
+
+
+class PoolMetrics:
+    """Checkout/wait timings and connection counters for one engine's pool"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wait_time_ms = Histogram()         # Time blocked obtaining a connection (queue + connect)
+        self.checkout_latency_ms = Histogram()  # Full checkout incl. pre-ping and reset
+        self.checkouts = Counter()
+        self.timeouts = Counter()
+        self.connects = Counter()
+        self.invalidations = Counter()
+        self.peak_checked_out = 0
+        self._checked_out = 0
+        self._lock = threading.Lock()
+
+    def on_checkout(self):
+        self.checkouts.inc()
+        with self._lock:
+            self._checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self._checked_out)
+
+    def on_checkin(self):
+        with self._lock:
+            self._checked_out = max(self._checked_out - 1, 0)
+
+
+class InstrumentedPoolMixin:
+    """Times checkouts; ``metrics`` is assigned by attach_pool_metrics()"""
+
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        if self.metrics is None:
+            return super()._do_get()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts.inc()
+            raise
+        finally:
+            self.metrics.wait_time_ms.observe((time.perf_counter() - start) * 1000)
+
+    def connect(self):
+        if self.metrics is None:
+            return super().connect()
+        start = time.perf_counter()
+        connection = super().connect()
+        self.metrics.checkout_latency_ms.observe((time.perf_counter() - start) * 1000)
+        return connection
+
+    def recreate(self):
+        # dispose() and invalidation swap in a fresh pool; keep its history
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedStaticPool(InstrumentedPoolMixin, StaticPool):
+    pass
+
+
+class InstrumentedNullPool(InstrumentedPoolMixin, NullPool):
+    pass
+
+
+SQLITE_POOLS = {
+    "queue": InstrumentedQueuePool,
+    "static": InstrumentedStaticPool,
+    "null": InstrumentedNullPool,
+}
+
+# Engine name -> (engine, metrics)
+_registry: Dict[str, tuple] = {}
+
+
+def attach_pool_metrics(engine, name: str) -> PoolMetrics:
+    """Start collecting pool metrics for ``engine`` (a sync Engine)"""
+    metrics = PoolMetrics(name)
+    engine.pool.metrics = metrics
+
+    event.listen(engine, "connect", lambda *args: metrics.connects.inc())
+    event.listen(engine, "checkout", lambda *args: metrics.on_checkout())
+    event.listen(engine, "checkin", lambda *args: metrics.on_checkin())
+    event.listen(engine, "invalidate", lambda *args: metrics.invalidations.inc())
+
+    _registry[name] = (engine, metrics)
+    return metrics
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers proceed during a write; busy_timeout waits out short locks"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def pool_status() -> dict:
+    """Snapshot of every instrumented pool"""
+    status = {}
+    for name, (engine, metrics) in _registry.items():
+        pool = engine.pool
+        stats = {"pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        else:
+            stats["checked_out"] = metrics._checked_out
+        stats.update({
+            "peak_checked_out": metrics.peak_checked_out,
+            "checkouts": metrics.checkouts.value,
+            "connects": metrics.connects.value,
+            "timeouts": metrics.timeouts.value,
+            "invalidations": metrics.invalidations.value,
+            "wait_time_ms": metrics.wait_time_ms.snapshot(),
+            "checkout_latency_ms": metrics.checkout_latency_ms.snapshot(),
+        })
+        status[name] = stats
+    return status
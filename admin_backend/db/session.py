@@ -1,10 +1,12 @@
 import os
 import logging
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from db.pool import SQLITE_POOLS, InstrumentedQueuePool, attach_pool_metrics, set_sqlite_pragmas
 from app.core.config import settings
+from app.core.instrumentation import attach_query_metrics, mark_threadpool_start
 
 logger = logging.getLogger(__name__)
 
@@ -14,30 +16,48 @@ if not settings.DATABASE_URL:
 DATABASE_URL = settings.DATABASE_URL
 logger.info(f"Connecting to database: {DATABASE_URL.split('@')[0]}@***")  # Hide credentials in logs
 
-# Configure engine with appropriate settings
-# For PostgreSQL, use connection pooling; for SQLite, use NullPool
+# Configure engine with appropriate settings (see Settings.DB_POOL_*)
 if DATABASE_URL.startswith("sqlite"):
+    # In-memory databases live in a single connection, so they must use StaticPool
+    in_memory = make_url(DATABASE_URL).database in (None, "", ":memory:")
+    sqlite_pool = "static" if in_memory else settings.SQLITE_POOL
+    pool_kwargs = {}
+    if sqlite_pool == "queue":
+        pool_kwargs = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+        }
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},  # SQLite specific
-        poolclass=NullPool
+        poolclass=SQLITE_POOLS[sqlite_pool],
+        **pool_kwargs
     )
+    if settings.SQLITE_WAL and not in_memory:
+        event.listen(engine, "connect", set_sqlite_pragmas)
 else:
     # PostgreSQL configuration
     engine = create_engine(
         DATABASE_URL,
-        pool_pre_ping=True,  # Verify connections before using them
-        pool_size=5,
-        max_overflow=10,
-        pool_recycle=3600,  # Recycle connections after 1 hour
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,  # Verify connections before using them
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
     )
 
+attach_pool_metrics(engine, "primary")
+attach_query_metrics(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 def get_db():
     """Database session dependency"""
+    mark_threadpool_start()  # Sync dependencies run in the threadpool; this is where the wait ends
     db = SessionLocal()
     try:
         yield db
@@ -0,0 +1,193 @@
+"""
+Synthetic Grants.gov extract generator
+
+Usage:
+    python generate_grants_extract.py output.zip [--count 10000] [--forecast-ratio 0.3]
+                                      [--malformed-ratio 0.02] [--seed 42]
+
+Writes a ZIP holding one GrantsDBExtract<date>v2.xml in the shape of the
+public Grants.gov extract: a <Grants> root in the OpportunityDetail-V1.0
+namespace with OpportunitySynopsisDetail_1_0 and OpportunityForecastDetail_1_0
+records. A share of the records is deliberately malformed the ways real
+extracts are: missing IDs or titles, unparseable or empty dates, duplicate
+IDs, entity-laden and oversized text. The document stays well-formed XML.
+
+The XML is streamed into the archive, so any size fits in constant memory.
+Output is deterministic for a given --seed.
+"""
+
+import argparse
+import os
+import random
+import time
+import zipfile
+from datetime import datetime, timedelta
+from xml.sax.saxutils import escape
+
+NAMESPACE = "http://apply.grants.gov/system/OpportunityDetail-V1.0"
+
+AGENCIES = (
+    ("HHS-ACF-ORR", "Administration for Children and Families - ORR"),
+    ("DOS-PRM", "Bureau of Population, Refugees, and Migration"),
+    ("ED-OESE", "Office of Elementary and Secondary Education"),
+    ("DOL-ETA", "Employment and Training Administration"),
+    ("HUD", "Department of Housing and Urban Development"),
+    ("USDA-FNS", "Food and Nutrition Service"),
+    ("HHS-CDC", "Centers for Disease Control and Prevention"),
+    ("DOJ-OJP", "Office of Justice Programs"),
+    ("USAID", "Agency for International Development"),
+    ("FEMA", "Federal Emergency Management Agency"),
+)
+TOPICS = (
+    "Refugee Resettlement", "Transitional Housing", "Adult Education and Literacy",
+    "Workforce Development", "Community Health Workers", "Legal Assistance for Asylum Seekers",
+    "Emergency Shelter", "Food Security", "Youth Mentoring", "Small Business Microloans",
+    "Mental Health Services", "English Language Acquisition", "Family Reunification",
+    "Disaster Recovery", "Agricultural Training", "Social Integration",
+)
+PHRASES = (
+    "This program supports eligible organizations serving newly arrived populations.",
+    "Applicants must demonstrate capacity to deliver culturally appropriate services.",
+    "Funds may be used for case management, training and direct assistance.",
+    "Priority will be given to projects in underserved communities.",
+    "The program aims to improve long-term self-sufficiency and integration outcomes.",
+    "Cost sharing is not required but strongly encouraged.",
+    "Awards will be made as cooperative agreements with substantial federal involvement.",
+    "Projects should include measurable performance indicators and an evaluation plan.",
+)
+ELIGIBILITY = (
+    "Nonprofits having a 501(c)(3) status with the IRS, other than institutions of higher education",
+    "State governments",
+    "County governments",
+    "Public and State controlled institutions of higher education",
+    "Native American tribal organizations",
+    "Others (see text field entitled \"Additional Information on Eligibility\" for clarification)",
+)
+FUNDING_CATEGORIES = ("HL", "ED", "ISS", "CD", "FN", "LJL", "DPR", "O")
+MALFORMATIONS = ("no_id", "no_title", "bad_date", "empty_dates", "duplicate_id", "entities", "oversized")
+
+
+def _date(value: datetime) -> str:
+    """Grants.gov dates are MMDDYYYY"""
+    return value.strftime("%m%d%Y")
+
+
+def _element(tag: str, value) -> str:
+    return f"<{tag}>{escape(str(value))}</{tag}>" if value is not None else ""
+
+
+def make_record(rng: random.Random, number: int, today: datetime, forecast: bool, malformation: str = None,
+                previous_id: str = None) -> str:
+    """One opportunity element as XML text"""
+    agency_code, agency_name = rng.choice(AGENCIES)
+    topic = rng.choice(TOPICS)
+    opportunity_id = str(300000 + number)
+    title = f"{topic} Program FY{today.year + rng.randint(0, 1)}"
+    description = " ".join(rng.sample(PHRASES, rng.randint(2, 6)))
+    posted = today - timedelta(days=rng.randint(0, 180))
+    close = posted + timedelta(days=rng.randint(30, 240))
+    updated = posted + timedelta(days=rng.randint(0, 30))
+    ceiling = rng.randint(5, 500) * 10000
+    close_text = _date(close)
+
+    if malformation == "no_id":
+        opportunity_id = None
+    elif malformation == "no_title":
+        title = None
+    elif malformation == "bad_date":
+        close_text = rng.choice(("TBD", "13/45/2025", "See description", "0000"))
+    elif malformation == "empty_dates":
+        close_text = ""
+    elif malformation == "duplicate_id" and previous_id:
+        opportunity_id = previous_id
+    elif malformation == "entities":
+        title = f"{title} & Partners <Phase II> – éducation \"pilot\""
+        description = f"{description} Contact: R&D <grants@example.gov>. © ™ 中文"
+    elif malformation == "oversized":
+        title = " ".join([title] * 40)
+        description = " ".join([description] * 200)
+
+    fields = [
+        _element("OpportunityID", opportunity_id),
+        _element("OpportunityTitle", title),
+        _element("OpportunityNumber", f"{agency_code}-{today.year % 100:02d}-{number:06d}"),
+        _element("OpportunityCategory", rng.choice(("D", "M", "C"))),
+        _element("FundingInstrumentType", rng.choice(("G", "CA"))),
+        _element("CategoryOfFundingActivity", rng.choice(FUNDING_CATEGORIES)),
+        _element("CFDANumbers", f"{rng.randint(10, 99)}.{rng.randint(100, 999)}"),
+        _element("EligibleApplicants", rng.choice(("00", "12", "25", "99"))),
+        _element("AdditionalInformationOnEligibility", rng.choice(ELIGIBILITY)),
+        _element("AgencyCode", agency_code),
+        _element("AgencyName", agency_name),
+        _element("PostDate", _date(posted)),
+        _element("CloseDate", close_text) if not forecast else "",
+        _element("LastUpdatedDate", _date(updated)),
+        _element("AwardCeiling", ceiling),
+        _element("AwardFloor", ceiling // 10),
+        _element("EstimatedTotalProgramFunding", ceiling * rng.randint(2, 20)),
+        _element("ExpectedNumberOfAwards", rng.randint(1, 40)),
+        _element("Description", description),
+        _element("Version", "Forecast 1" if forecast else "Synopsis 1"),
+        _element("CostSharingOrMatchingRequirement", rng.choice(("Yes", "No"))),
+        _element("ArchiveDate", _date(close + timedelta(days=30))),
+        _element("GrantorContactEmail", f"grants@{agency_code.lower().split('-')[0]}.example.gov"),
+    ]
+    if forecast:
+        fields += [
+            _element("EstimatedSynopsisPostDate", _date(posted + timedelta(days=60))),
+            _element("EstimatedApplicationDueDate", close_text),
+            _element("FiscalYear", today.year + 1),
+        ]
+    tag = "OpportunityForecastDetail_1_0" if forecast else "OpportunitySynopsisDetail_1_0"
+    return f"<{tag}>{''.join(fields)}</{tag}>\n"
+
+
+def generate_extract(path: str, count: int, forecast_ratio: float = 0.3, malformed_ratio: float = 0.02,
+                     seed: int = 42) -> dict:
+    """Write a synthetic extract ZIP; returns counts of what was written"""
+    rng = random.Random(seed)
+    today = datetime(2026, 1, 15)  # Fixed, so output depends only on the seed
+    stats = {"records": 0, "forecasts": 0, "malformed": 0}
+    previous_id = None
+
+    member = f"GrantsDBExtract{today:%Y%m%d}v2.xml"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open(member, "w", force_zip64=True) as out:
+            out.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<Grants xmlns="{NAMESPACE}">\n'.encode("utf-8"))
+            buffer = []
+            for number in range(count):
+                forecast = rng.random() < forecast_ratio
+                malformation = rng.choice(MALFORMATIONS) if rng.random() < malformed_ratio else None
+                buffer.append(make_record(rng, number, today, forecast, malformation, previous_id))
+                previous_id = str(300000 + number)
+                stats["records"] += 1
+                stats["forecasts"] += forecast
+                stats["malformed"] += malformation is not None
+                if len(buffer) >= 1000:
+                    out.write("".join(buffer).encode("utf-8"))
+                    buffer = []
+            buffer.append("</Grants>\n")
+            out.write("".join(buffer).encode("utf-8"))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("output", help="ZIP file to write")
+    parser.add_argument("--count", type=int, default=10000, help="Opportunities to write")
+    parser.add_argument("--forecast-ratio", type=float, default=0.3)
+    parser.add_argument("--malformed-ratio", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = generate_extract(args.output, args.count, args.forecast_ratio, args.malformed_ratio, args.seed)
+    print(
+        f"Wrote {stats['records']} opportunities ({stats['forecasts']} forecasts, "
+        f"{stats['malformed']} malformed) to {args.output}: "
+        f"{os.path.getsize(args.output) / 1024 / 1024:.1f} MB in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Email outbox regression tests
+
+- Approving or rejecting an organization without a contact email still
+  succeeds; no outbox row is written for it.
+- One rejected recipient in a drained batch fails only its own row.
+- A transient provider error is sent once and left to the outbox backoff,
+  without resending the batch message by message.
+
+Runs against a throwaway SQLite database:
+    python test_email_outbox.py
+"""
+
+import sys
+import os
+import tempfile
+from datetime import timedelta
+
+# Isolated database, set before the app reads its settings. Under pytest the
+# first test module to import the app picks it and later modules share it, so
+# seeding below tolerates rows another module already created.
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'email_outbox.db')}"
+os.environ["EMAIL_OUTBOX_DRAINER"] = "false"  # Drained explicitly below
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core import security
+from app.services.email_dispatcher import EmailMessage, EmailTransportError, email_dispatcher
+from app.services.email_outbox import email_outbox_drainer, enqueue_email
+from db.session import SessionLocal, Base, engine
+from db import models
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+def _seed_admin():
+    db = SessionLocal()
+    try:
+        admin = db.query(models.User).filter(models.User.email == "admin@example.com").first()
+        if admin is None:
+            admin = models.User(email="admin@example.com", hashed_password="x", role="admin",
+                                is_verified=True, is_active=True)
+            db.add(admin)
+            db.commit()
+        token = security.create_access_token(admin.email, admin.id, admin.role)
+        return {"Authorization": f"Bearer {token}"}
+    finally:
+        db.close()
+
+
+HEADERS = _seed_admin()
+
+
+def _create_org(name: str, contact_email=None) -> int:
+    db = SessionLocal()
+    try:
+        user = models.User(email=f"outbox-{name}@example.com", hashed_password="x", role="user", is_verified=True)
+        db.add(user)
+        db.flush()
+        org = models.Organization(user_id=user.id, name=name, status="pending", contact_email=contact_email)
+        db.add(org)
+        db.commit()
+        return org.id
+    finally:
+        db.close()
+
+
+def _outbox_count() -> int:
+    db = SessionLocal()
+    try:
+        return db.query(models.EmailOutbox).count()
+    finally:
+        db.close()
+
+
+def _org_status(org_id: int) -> str:
+    db = SessionLocal()
+    try:
+        return db.query(models.Organization.status).filter(models.Organization.id == org_id).scalar()
+    finally:
+        db.close()
+
+
+def test_moderation_without_contact_email():
+    """Orgs with no contact email are approved/rejected without queueing an email"""
+    before = _outbox_count()
+
+    approved = _create_org("no-email-approve")
+    response = client.post(f"/organizations/admin/{approved}/approve", headers=HEADERS)
+    assert response.status_code == 200, response.text
+    assert "not sent" in response.json()["message"], response.json()
+    assert _org_status(approved) == "approved"
+
+    rejected = _create_org("no-email-reject")
+    response = client.post(f"/organizations/admin/{rejected}/reject", json={"reason": "Incomplete"}, headers=HEADERS)
+    assert response.status_code == 200, response.text
+    assert "not sent" in response.json()["message"], response.json()
+    assert _org_status(rejected) == "rejected"
+
+    assert _outbox_count() == before
+
+
+def test_moderation_with_contact_email_queues_email():
+    """The usual case still writes one outbox row"""
+    before = _outbox_count()
+    org_id = _create_org("with-email", contact_email="contact@with-email.org")
+    response = client.post(f"/organizations/admin/{org_id}/approve", headers=HEADERS)
+    assert response.status_code == 200, response.text
+    assert response.json()["email"] == "contact@with-email.org"
+    assert _outbox_count() == before + 1
+
+
+class RejectingTransport:
+    """Fails any batch containing a bad@ recipient, like a provider 400"""
+
+    def send(self, messages):
+        if any(message.to.startswith("bad@") for message in messages):
+            raise EmailTransportError("400 invalid recipient", retryable=False)
+
+
+def test_bad_recipient_fails_only_its_row():
+    """A batch rejected because of one recipient is resent message by message"""
+    db = SessionLocal()
+    try:
+        db.query(models.EmailOutbox).delete()
+        for recipient in ("good1@example.com", "bad@example.com", "good2@example.com"):
+            enqueue_email(db, EmailMessage(to=recipient, subject="Hello", html_content="<p>Hi</p>"))
+        db.commit()
+    finally:
+        db.close()
+
+    transport = email_dispatcher.transport
+    email_dispatcher.transport = RejectingTransport()
+    try:
+        assert email_outbox_drainer.run_once() == 3
+    finally:
+        email_dispatcher.transport = transport
+
+    db = SessionLocal()
+    try:
+        statuses = dict(db.query(models.EmailOutbox.recipient, models.EmailOutbox.status).all())
+    finally:
+        db.close()
+    assert statuses["good1@example.com"] == "sent", statuses
+    assert statuses["good2@example.com"] == "sent", statuses
+    assert statuses["bad@example.com"] == "pending", statuses
+
+
+class UnavailableTransport:
+    """Fails every batch like a provider outage (503 with Retry-After)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def send(self, messages):
+        self.calls += 1
+        raise EmailTransportError("Status 503: unavailable", retryable=True, retry_after=120)
+
+
+def test_transient_error_is_not_split():
+    """A retryable failure is one provider call; every row waits for the backoff"""
+    db = SessionLocal()
+    try:
+        db.query(models.EmailOutbox).delete()
+        for i in range(3):
+            enqueue_email(db, EmailMessage(to=f"user{i}@example.com", subject="Hello", html_content="<p>Hi</p>"))
+        db.commit()
+    finally:
+        db.close()
+
+    transport = email_dispatcher.transport
+    email_dispatcher.transport = unavailable = UnavailableTransport()
+    try:
+        assert email_outbox_drainer.run_once() == 3
+    finally:
+        email_dispatcher.transport = transport
+    assert unavailable.calls == 1, unavailable.calls
+
+    db = SessionLocal()
+    try:
+        rows = db.query(models.EmailOutbox).all()
+        assert all(row.status == "pending" for row in rows), [row.status for row in rows]
+        # Retry-After (120s) outweighs the first backoff step
+        assert all(row.available_at - row.claimed_at >= timedelta(seconds=120) for row in rows), rows
+    finally:
+        db.close()
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("EMAIL OUTBOX REGRESSION TESTS")
+    print("=" * 60)
+
+    tests = [
+        ("Moderation without contact email", test_moderation_without_contact_email),
+        ("Moderation with contact email", test_moderation_with_contact_email_queues_email),
+        ("Bad recipient isolated", test_bad_recipient_fails_only_its_row),
+        ("Transient error not split", test_transient_error_is_not_split),
+    ]
+
+    failed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ PASS: {test_name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL: {test_name}: {e}")
+
+    print("=" * 60)
+    print(f"Results: {len(tests) - failed}/{len(tests)} tests passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    run_all_tests()
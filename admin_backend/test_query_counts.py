@@ -0,0 +1,181 @@
+"""
+Query-count regression test for grant serialization
+
+Grant.creator_role used to lazy-load the creator relationship, firing one
+extra SELECT per serialized grant. This script checks that grant read and
+write endpoints issue the same number of statements whatever the page size.
+
+Runs against a throwaway SQLite database:
+    python test_query_counts.py
+"""
+
+import sys
+import os
+import tempfile
+
+# Isolated database, set before the app reads its settings. Under pytest the
+# first test module to import the app picks it and later modules share it, so
+# seeding below tolerates rows another module already created.
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'query_counts.db')}"
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.core import security
+from app.core.cache import invalidate_grant_caches
+from db.session import SessionLocal, Base, engine
+from db import models
+
+Base.metadata.create_all(bind=engine)
+client = TestClient(app)
+
+
+class StatementCounter:
+    """Counts SQL statements executed on the engine inside a with-block"""
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def _get_or_create_admin(db) -> models.User:
+    admin = db.query(models.User).filter(models.User.email == "admin@example.com").first()
+    if admin is None:
+        admin = models.User(email="admin@example.com", hashed_password="x", role="admin",
+                            is_verified=True, is_active=True)
+        db.add(admin)
+    return admin
+
+
+def _seed():
+    """An admin, 25 creators with different roles and 150 grants spread across them"""
+    db = SessionLocal()
+    try:
+        admin = _get_or_create_admin(db)
+        creators = [
+            models.User(email=f"query-creator{i}@example.com", hashed_password="x",
+                        role="organization" if i % 2 else "user", is_verified=True)
+            for i in range(25)
+        ]
+        db.add_all(creators)
+        db.flush()
+        for i in range(150):
+            db.add(models.Grant(
+                title=f"Water grant {i}",
+                organizer="Agency",
+                apply_url="https://example.com",
+                deadline=datetime.utcnow() + timedelta(days=30),
+                creator_id=creators[i % 25].id if i % 10 else None,
+            ))
+        db.commit()
+        token = security.create_access_token(admin.email, admin.id, admin.role)
+        return {"Authorization": f"Bearer {token}"}
+    finally:
+        db.close()
+
+
+HEADERS = _seed()
+
+
+def _count(method: str, url: str, **kwargs) -> int:
+    invalidate_grant_caches()  # Measure the database path, not the response cache
+    client.get("/auth/me", headers=HEADERS)  # Warm the auth principal cache
+    with StatementCounter() as counter:
+        response = client.request(method, url, headers=HEADERS, **kwargs)
+    assert response.status_code == 200, response.text
+    return counter.count
+
+
+def test_list_pages_constant_queries():
+    """Admin listings: 10-row and 100-row pages cost the same number of statements
+    (the grants-table version read for the ETag, then the page itself)"""
+    for path in ("/grants/admin/all", "/grants/admin/unverified"):
+        small = _count("GET", f"{path}?limit=10")
+        large = _count("GET", f"{path}?limit=100")
+        print(f"{path}: {small} statements for 10 rows, {large} for 100 rows")
+        assert small == large == 2, (path, small, large)
+
+
+def test_search_constant_queries():
+    """Search results are serialized without per-row lookups"""
+    small = _count("GET", "/grants/search?q=water&limit=10")
+    large = _count("GET", "/grants/search?q=water&limit=100")
+    print(f"/grants/search: {small} statements for 10 rows, {large} for 100 rows")
+    assert small == large, (small, large)
+
+
+def test_creator_role_values():
+    """creator_role still reflects the creator (or 'user' when there is none)"""
+    invalidate_grant_caches()
+    grants = client.get("/grants/admin/all?limit=100", headers=HEADERS).json()
+    db = SessionLocal()
+    try:
+        roles = dict(db.query(models.User.id, models.User.role).all())
+    finally:
+        db.close()
+    for grant in grants:
+        expected = roles[grant["creator_id"]] if grant["creator_id"] else "user"
+        assert grant["creator_role"] == expected, grant
+
+
+def test_write_endpoints_no_creator_lookup():
+    """Single-grant writes don't issue a separate users query to serialize creator_role"""
+    db = SessionLocal()
+    grant_id = db.query(models.Grant.id).filter(models.Grant.creator_id.isnot(None)).first()[0]
+    db.close()
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.put(f"/grants/admin/{grant_id}/verify", headers=HEADERS)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert response.status_code == 200, response.text
+    assert response.json()["creator_role"] in ("user", "organization")
+    standalone_user_selects = [s for s in statements if s.lstrip().upper().startswith("SELECT USERS.")]
+    assert not standalone_user_selects, standalone_user_selects
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("GRANT QUERY-COUNT REGRESSION TESTS")
+    print("=" * 60)
+
+    tests = [
+        ("List pages", test_list_pages_constant_queries),
+        ("Search", test_search_constant_queries),
+        ("creator_role values", test_creator_role_values),
+        ("Write endpoints", test_write_endpoints_no_creator_lookup),
+    ]
+
+    failed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ PASS: {test_name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL: {test_name}: {e}")
+
+    print("=" * 60)
+    print(f"Results: {len(tests) - failed}/{len(tests)} tests passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -1,3 +1,5 @@
+import 'dart:async';
+
 import 'package:flutter/material.dart';
 import 'package:flutter/services.dart';
 import 'package:google_fonts/google_fonts.dart';
@@ -33,6 +35,8 @@ class _AdminDashboardScreenState extends State<AdminDashboardScreen> {
   List<Grant> _filteredVerifiedGrants = [];
   List<Grant> _filteredUnverifiedGrants = [];
   List<Organization> _filteredOrganizations = [];
+  Timer? _searchDebounce;
+  static const Duration _searchDebounceDelay = Duration(milliseconds: 300);
 
   bool _isLoading = true;
   final GrantService _grantService = GrantService();
@@ -46,6 +50,7 @@ class _AdminDashboardScreenState extends State<AdminDashboardScreen> {
 
   @override
   void dispose() {
+    _searchDebounce?.cancel();
     _searchController.dispose();
     super.dispose();
   }
@@ -98,24 +103,40 @@ class _AdminDashboardScreenState extends State<AdminDashboardScreen> {
   }
 
   void _applySearch() {
-    final query = _searchController.text.toLowerCase();
+    final query = _searchController.text.trim();
     setState(() {
       if (query.isEmpty) {
         _filteredVerifiedGrants = _verifiedGrants;
         _filteredUnverifiedGrants = _unverifiedGrants;
         _filteredOrganizations = _organizations;
       } else {
-        _filteredVerifiedGrants = _verifiedGrants
-            .where((g) => g.title.toLowerCase().contains(query) || g.organizer.toLowerCase().contains(query))
-            .toList();
-        _filteredUnverifiedGrants = _unverifiedGrants
-            .where((g) => g.title.toLowerCase().contains(query) || g.organizer.toLowerCase().contains(query))
-            .toList();
         _filteredOrganizations = _organizations
-            .where((o) => o.name.toLowerCase().contains(query))
+            .where((o) => o.name.toLowerCase().contains(query.toLowerCase()))
             .toList();
       }
     });
+    // Wait for a pause in typing instead of searching on every keystroke
+    _searchDebounce?.cancel();
+    if (query.isNotEmpty && _selectedTab != 2) {
+      _searchDebounce = Timer(_searchDebounceDelay, () => _searchGrants(query));
+    }
+  }
+
+  // Grant search runs server-side so it covers the whole catalogue
+  Future<void> _searchGrants(String query) async {
+    try {
+      final results = await _grantService.searchGrants(query);
+      // Ignore responses for a query the user has already changed
+      if (!mounted || _searchController.text.trim() != query) return;
+      setState(() {
+        _filteredVerifiedGrants = results.where((g) => g.isVerified).toList();
+        _filteredUnverifiedGrants = results.where((g) => !g.isVerified).toList();
+      });
+    } catch (e) {
+      // Only report failures for the query still in the search box
+      if (!mounted || _searchController.text.trim() != query) return;
+      _showError('Error searching grants: $e');
+    }
   }
 
   void _showError(String message) {
@@ -49,6 +49,30 @@ class GrantService {
     }
   }
 
+  // Full-text search across all grants (admin only, ranked server-side)
+  Future<List<Grant>> searchGrants(String query, {int limit = 100}) async {
+    final token = await _authService.getToken();
+    if (token == null) throw Exception('Authentication required');
+
+    final uri = Uri.parse('$baseUrl/grants/search').replace(
+      queryParameters: {'q': query, 'limit': '$limit'},
+    );
+    final response = await http.get(
+      uri,
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': 'Bearer $token',
+      },
+    );
+
+    if (response.statusCode == 200) {
+      final List<dynamic> data = jsonDecode(response.body);
+      return data.map((json) => _fromJson(json)).toList();
+    } else {
+      throw Exception('Failed to search grants: ${response.statusCode}');
+    }
+  }
+
   // Create a grant
   Future<Grant> createGrant(Grant grant) async {
     final token = await _authService.getToken();
@@ -129,7 +153,7 @@ class GrantService {
     }
   }
 
-  // Import grants from Grants.gov
+  // Start a background import from Grants.gov (returns the import job status)
   Future<Map<String, dynamic>> importFromGrantsGov() async {
     final token = await _authService.getToken();
     if (token == null) throw Exception('Authentication required');
@@ -140,15 +164,35 @@ class GrantService {
         'Authorization': 'Bearer $token',
         'Content-Type': 'application/json',
       },
-    ).timeout(const Duration(minutes: 5)); // Long timeout for import
+    ).timeout(const Duration(seconds: 30));
 
-    if (response.statusCode == 200) {
+    if (response.statusCode == 200 || response.statusCode == 202) {
       return jsonDecode(response.body);
     } else {
       throw Exception('Failed to import grants: ${response.body}');
     }
   }
 
+  // Poll the progress of a Grants.gov import job
+  Future<Map<String, dynamic>> getImportJob(String jobId) async {
+    final token = await _authService.getToken();
+    if (token == null) throw Exception('Authentication required');
+
+    final response = await http.get(
+      Uri.parse('$baseUrl/grants/admin/import/jobs/$jobId'),
+      headers: {
+        'Authorization': 'Bearer $token',
+        'Content-Type': 'application/json',
+      },
+    );
+
+    if (response.statusCode == 200) {
+      return jsonDecode(response.body);
+    } else {
+      throw Exception('Failed to load import job: ${response.body}');
+    }
+  }
+
   // Helper methods to convert between Grant model and Backend JSON
   // Note: Backend JSON keys might differ slightly, adjusting here.
   Grant _fromJson(Map<String, dynamic> json) {